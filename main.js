@@ -448,9 +448,137 @@ ipcMain.handle('save_work_position_json', async (event, { positionMm, setpointMm
   }
 });
 
+// Dispatch a single message from the Python controller to the renderer windows
+function handlePythonMessage(data) {
+  if (data.type === 'update_element' && mainWindow) {
+    // Cache the element state
+    if (!cachedUIState.elements) cachedUIState.elements = {};
+    cachedUIState.elements[data.element_id] = {
+      property: data.property || 'textContent',
+      value: data.value || data.text || ''
+    };
+    
+    // Send message to renderer process to update DOM
+    mainWindow.webContents.send('update-element', {
+      elementId: data.element_id,
+      property: data.property || 'textContent',
+      value: data.value || data.text || ''
+    });
+  } else if (data.type === 'update_progress_bar' && mainWindow) {
+    // Cache progress bar state
+    if (!cachedUIState.progressBars) cachedUIState.progressBars = {};
+    cachedUIState.progressBars[data.element_id] = data.progress;
+    
+    // Send message to renderer process to update progress bar
+    mainWindow.webContents.send('update-progress-bar', {
+      elementId: data.element_id,
+      progress: data.progress
+    });
+  } else if (data.type === 'update_slider' && mainWindow) {
+    // Cache slider position
+    cachedUIState.sliderPosition = data.position;
+    
+    // Send message to renderer process to update slider position
+    mainWindow.webContents.send('update-slider', {
+      position: data.position
+    });
+  } else if (data.type === 'update_progress_states' && mainWindow) {
+    // Cache progress states
+    cachedUIState.progressStates = data.states;
+    
+    // Send message to renderer process to update progress states
+    mainWindow.webContents.send('update-progress-states', {
+      states: data.states
+    });
+  } else if (data.type === 'update_progress_text' && mainWindow) {
+    // Cache progress text
+    cachedUIState.progressText = data.text;
+    
+    // Send message to renderer process to update progress text
+    mainWindow.webContents.send('update-progress-text', {
+      text: data.text
+    });
+  } else if (data.type === 'update_tip_state' && mainWindow) {
+    // Cache tip states
+    if (!cachedUIState.tipStates) cachedUIState.tipStates = {};
+    cachedUIState.tipStates[data.tip_number] = data.is_active;
+    
+    // Send message to renderer process to update tip active/inactive state
+    mainWindow.webContents.send('update-tip-state', {
+      tipNumber: data.tip_number,
+      isActive: data.is_active
+    });
+  } else if (data.type === 'work_position_update' && mainWindow) {
+    // Cache work position data
+    cachedUIState.workPositionData = data.data;
+    
+    // Send work position update to all renderer windows
+    mainWindow.webContents.send('work-position-update', data.data);
+    // Also send to all other windows
+    BrowserWindow.getAllWindows().forEach(window => {
+      if (window !== mainWindow) {
+        window.webContents.send('work-position-update', data.data);
+      }
+    });
+  } else if (data.type === 'update_speed_buttons' && mainWindow) {
+    // Send speed button update to renderer
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('update-speed-buttons', {
+        rapid_active: data.rapid_active,
+        fine_active: data.fine_active
+      });
+    });
+  } else if (data.type === 'update_button_state' && mainWindow) {
+    // Send button state update to renderer
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('update-button-state', {
+        button_id: data.button_id,
+        pressed: data.pressed
+      });
+    });
+  } else if (data.type === 'modbus_update' && mainWindow) {
+    // Send Modbus data update to all renderer windows
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('modbus-update', data);
+    });
+  } else if (data.type === 'heating_update' && mainWindow) {
+    // Send heating setpoint update to all renderer windows
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('heating-update', data);
+    });
+  } else if (data.type === 'monitor_update' && mainWindow) {
+    // Forward monitor screen updates to all windows
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('monitor-update', data);
+    });
+  } else if (data.type === 'manual_controls_update' && mainWindow) {
+    // Forward manual controls updates to all windows
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('manual-controls-update', data);
+    });
+  } else if (data.type === 'update_slider_position' && mainWindow) {
+    // Send slider position update to renderer
+    BrowserWindow.getAllWindows().forEach(window => {
+      window.webContents.send('update-slider-position', {
+        slider_id: data.slider_id,
+        percentage: data.percentage
+      });
+    });
+  }
+}
+
 // WebSocket server functions
 function startWebSocketServer() {
-  wss = new WebSocket.Server({ port: 8080 });
+  // Accept permessage-deflate without context takeover (matches the Python client);
+  // our own sends are only compressed above the threshold
+  wss = new WebSocket.Server({
+    port: 8080,
+    perMessageDeflate: {
+      serverNoContextTakeover: true,
+      clientNoContextTakeover: true,
+      threshold: 1024
+    }
+  });
   
   wss.on('connection', (ws) => {
     console.log('Python script connected to WebSocket server');
@@ -459,120 +587,11 @@ function startWebSocketServer() {
       try {
         const data = JSON.parse(message);
         
-        if (data.type === 'update_element' && mainWindow) {
-          // Cache the element state
-          if (!cachedUIState.elements) cachedUIState.elements = {};
-          cachedUIState.elements[data.element_id] = {
-            property: data.property || 'textContent',
-            value: data.value || data.text || ''
-          };
-          
-          // Send message to renderer process to update DOM
-          mainWindow.webContents.send('update-element', {
-            elementId: data.element_id,
-            property: data.property || 'textContent',
-            value: data.value || data.text || ''
-          });
-        } else if (data.type === 'update_progress_bar' && mainWindow) {
-          // Cache progress bar state
-          if (!cachedUIState.progressBars) cachedUIState.progressBars = {};
-          cachedUIState.progressBars[data.element_id] = data.progress;
-          
-          // Send message to renderer process to update progress bar
-          mainWindow.webContents.send('update-progress-bar', {
-            elementId: data.element_id,
-            progress: data.progress
-          });
-        } else if (data.type === 'update_slider' && mainWindow) {
-          // Cache slider position
-          cachedUIState.sliderPosition = data.position;
-          
-          // Send message to renderer process to update slider position
-          mainWindow.webContents.send('update-slider', {
-            position: data.position
-          });
-        } else if (data.type === 'update_progress_states' && mainWindow) {
-          // Cache progress states
-          cachedUIState.progressStates = data.states;
-          
-          // Send message to renderer process to update progress states
-          mainWindow.webContents.send('update-progress-states', {
-            states: data.states
-          });
-        } else if (data.type === 'update_progress_text' && mainWindow) {
-          // Cache progress text
-          cachedUIState.progressText = data.text;
-          
-          // Send message to renderer process to update progress text
-          mainWindow.webContents.send('update-progress-text', {
-            text: data.text
-          });
-        } else if (data.type === 'update_tip_state' && mainWindow) {
-          // Cache tip states
-          if (!cachedUIState.tipStates) cachedUIState.tipStates = {};
-          cachedUIState.tipStates[data.tip_number] = data.is_active;
-          
-          // Send message to renderer process to update tip active/inactive state
-          mainWindow.webContents.send('update-tip-state', {
-            tipNumber: data.tip_number,
-            isActive: data.is_active
-          });
-        } else if (data.type === 'work_position_update' && mainWindow) {
-          // Cache work position data
-          cachedUIState.workPositionData = data.data;
-          
-          // Send work position update to all renderer windows
-          mainWindow.webContents.send('work-position-update', data.data);
-          // Also send to all other windows
-          BrowserWindow.getAllWindows().forEach(window => {
-            if (window !== mainWindow) {
-              window.webContents.send('work-position-update', data.data);
-            }
-          });
-        } else if (data.type === 'update_speed_buttons' && mainWindow) {
-          // Send speed button update to renderer
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('update-speed-buttons', {
-              rapid_active: data.rapid_active,
-              fine_active: data.fine_active
-            });
-          });
-        } else if (data.type === 'update_button_state' && mainWindow) {
-          // Send button state update to renderer
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('update-button-state', {
-              button_id: data.button_id,
-              pressed: data.pressed
-            });
-          });
-        } else if (data.type === 'modbus_update' && mainWindow) {
-          // Send Modbus data update to all renderer windows
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('modbus-update', data);
-          });
-        } else if (data.type === 'heating_update' && mainWindow) {
-          // Send heating setpoint update to all renderer windows
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('heating-update', data);
-          });
-        } else if (data.type === 'monitor_update' && mainWindow) {
-          // Forward monitor screen updates to all windows
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('monitor-update', data);
-          });
-        } else if (data.type === 'manual_controls_update' && mainWindow) {
-          // Forward manual controls updates to all windows
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('manual-controls-update', data);
-          });
-        } else if (data.type === 'update_slider_position' && mainWindow) {
-          // Send slider position update to renderer
-          BrowserWindow.getAllWindows().forEach(window => {
-            window.webContents.send('update-slider-position', {
-              slider_id: data.slider_id,
-              percentage: data.percentage
-            });
-          });
+        // The controller coalesces each update tick into one batch frame
+        if (data.type === 'batch' && Array.isArray(data.messages)) {
+          data.messages.forEach(handlePythonMessage);
+        } else {
+          handlePythonMessage(data);
         }
       } catch (error) {
         console.error('Error parsing WebSocket message:', error);
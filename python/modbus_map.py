@@ -27,27 +27,68 @@ Address Range Organization:
  - 1900-1999: Manual controls (buttons, cooling, etc.)
 """
 
+import struct
+from functools import lru_cache
+from types import MappingProxyType
+
+__all__ = [
+    # Address maps
+    'SYSTEM_CONFIG', 'TIP_OFFSET', 'TIP_BASE_ADDRESSES', 'PROGRESS_STATES',
+    'GENERAL_UI', 'MONITOR_STATUS', 'MANUAL_CONTROLS', 'TEXT_STRINGS',
+    'WORK_POSITION', 'CONFIGURATION_OFFSETS', 'CONFIGURATION_SCALES',
+    'CONFIGURATION_DECIMALS',
+    'WORK_POSITION_TIP_BASE', 'WORK_POSITION_TIP_OFFSET',
+    'HEATING_ENERGY_BASE', 'HEATING_ENERGY_OFFSET',
+    'HEATING_DISTANCE_BASE', 'HEATING_DISTANCE_OFFSET',
+    'HEATING_HEAT_START_DELAY_BASE', 'HEATING_HEAT_START_DELAY_OFFSET',
+    'CONFIGURATION_BASE',
+    # Precomputed address tables
+    'TIP_ADDRESSES', 'WORK_POSITION_TIP_ADDRESSES', 'MANUAL_HEATING_BUTTON_ADDRESSES',
+    'HEATING_ENERGY_ADDRESSES', 'HEATING_DISTANCE_ADDRESSES',
+    'HEATING_HEAT_START_DELAY_ADDRESSES', 'CONFIGURATION_ADDRESSES',
+    # Address constants
+    'PROG_HOME', 'GENERAL_TIME_MINUTES', 'BANNER_TEXT',
+    'WP_CURRENT_POSITION', 'WP_SETPOINT', 'WP_SPEED_MODE',
+    'WP_UP_BUTTON', 'WP_DOWN_BUTTON', 'WP_SET_POSITION_CMD',
+    'MANUAL_COOLING', 'TIP_ACTIVE', 'MANUAL_HEATING_BUTTONS',
+    'HEATING_ENERGY',
+    # Address helpers
+    'get_tip_address', 'get_progress_address', 'get_general_ui_address',
+    'get_monitor_address', 'get_work_position_address',
+    'get_work_position_tip_distance_address', 'get_manual_heating_button_address',
+    'get_manual_cooling_address', 'get_heating_energy_address',
+    'get_heating_distance_address', 'get_heating_heat_start_delay_address',
+    'get_configuration_address',
+    # Conversion helpers
+    'float_to_registers', 'registers_to_float',
+    'registers_to_floats',
+    'string_to_registers', 'registers_to_string',
+    # Read packets
+    'MODBUS_READ_PACKETS',
+    'MAX_WRITE_COUNT', 'coalesce_write_packets',
+]
+
 # System Configuration Registers (0-99)
-SYSTEM_CONFIG = {
+SYSTEM_CONFIG = MappingProxyType({
     'baudrate': 0,          # 9600, 19200, 38400, 57600, 115200, 1000000
     'parity': 1,            # 0=None, 1=Even, 2=Odd
     'stopbits': 2,          # 1 or 2
     'bytesize': 3,          # 7 or 8
     'slave_id': 4,          # 1-247
     'update_rate': 5,       # Update rate in Hz (1-100)
-}
+})
 
 # Tip Data Structure (repeated for tips 1-8)
 # Each tip uses 100 addresses starting at base_address
-TIP_OFFSET = {
+TIP_OFFSET = MappingProxyType({
     'active': 0,            # 0=inactive, 1=active (1 register)
     'progress': 1,          # 0-100 (1 register) - Progress percentage
     'joules': 2,            # Joules * 10 (to handle decimals) (1 register)
     'distance': 3,          # Distance * 1000 (mm with 3 decimals) (2 registers, 32-bit)
-}
+})
 
 # Tip Base Addresses
-TIP_BASE_ADDRESSES = {
+TIP_BASE_ADDRESSES = MappingProxyType({
     1: 100,
     2: 200,
     3: 300,
@@ -56,41 +97,41 @@ TIP_BASE_ADDRESSES = {
     6: 600,
     7: 700,
     8: 800,
-}
+})
 
 # Progress States (1000-1099)
-PROGRESS_STATES = {
+PROGRESS_STATES = MappingProxyType({
     'home': 1000,           # 0=inactive, 1=active, 2=done
     'work_position': 1001,
     'encoder_zero': 1002,
     'heat': 1003,
     'cool': 1004,
     'cycle_complete': 1005,
-}
+})
 
 # Time and General UI (1100-1199)
-GENERAL_UI = {
+GENERAL_UI = MappingProxyType({
     'time_minutes': 1100,   # Minutes (1 register)
     'time_seconds': 1101,   # Seconds (1 register)
     'slider_percentage': 1102,  # 0-100 (1 register)
-}
+})
 
 # Monitor screen statuses (re-using the 1100-1199 range)
 # All values are single-register integers unless noted
-MONITOR_STATUS = {
+MONITOR_STATUS = MappingProxyType({
     'pressure_psi': 1103,     # PSI value (integer)
     'left_start': 1104,       # 0/1
     'right_start': 1105,      # 0/1
     'estop_active': 1106,     # 0/1
     'home_switch': 1107,      # 0/1
     'pressure_ok': 1108,      # 0/1
-}
+})
 
 # Manual Controls (1900-1999)
 # Discrete button states as single holding registers (0/1)
 # The platen up/down buttons continue to use WORK_POSITION addresses
 # so they are shared consistently across screens.
-MANUAL_CONTROLS = {
+MANUAL_CONTROLS = MappingProxyType({
     'heating_button_1': 1900,
     'heating_button_2': 1901,
     'heating_button_3': 1902,
@@ -100,24 +141,24 @@ MANUAL_CONTROLS = {
     'heating_button_7': 1906,
     'heating_button_8': 1907,
     'cooling_button': 1908,
-}
+})
 
 # Banner and Text Strings (1200-1299)
 # Strings are stored as multiple registers (2 chars per register)
-TEXT_STRINGS = {
+TEXT_STRINGS = MappingProxyType({
     'banner_text': 1200,    # 20 registers (40 chars max)
     'processing_text': 1220, # 20 registers (40 chars max)
-}
+})
 
 # Work Position Data (1300-1399)
-WORK_POSITION = {
+WORK_POSITION = MappingProxyType({
     'current_position': 1300,    # Current position in mm * 100 (2 registers, 32-bit)
     'setpoint': 1302,           # Setpoint in mm * 100 (2 registers, 32-bit)
     'speed_mode': 1304,         # 0=rapid, 1=fine (1 register)
     'up_button_state': 1305,    # 0=released, 1=pressed (1 register)
     'down_button_state': 1306,  # 0=released, 1=pressed (1 register)
     'set_position_cmd': 1307,   # Command to set work position (1 register)
-}
+})
 
 # Work Position Tip Distances (1400-1499)
 # Each tip uses 2 registers for distance (32-bit float)
@@ -140,60 +181,129 @@ HEATING_HEAT_START_DELAY_OFFSET = 2  # 2 registers per tip
 # Configuration Screen (1800-1899)
 # Six counters stored as 32-bit scaled values (2 registers each)
 CONFIGURATION_BASE = 1800
-CONFIGURATION_OFFSETS = {
+CONFIGURATION_OFFSETS = MappingProxyType({
     'weld_time': 0,              # seconds, scale 100
     'pulse_energy': 2,           # joules, scale 10
     'cool_time': 4,              # seconds, scale 100
     'presence_height': 6,        # mm, scale 1000
     'boss_tolerance_minus': 8,   # mm, scale 1000
     'boss_tolerance_plus': 10,   # mm, scale 1000
-}
+})
+
+# Fixed-point scale of each configuration counter (register value = round(value * scale))
+CONFIGURATION_SCALES = MappingProxyType({
+    'weld_time': 100,
+    'pulse_energy': 10,
+    'cool_time': 100,
+    'presence_height': 1000,
+    'boss_tolerance_minus': 1000,
+    'boss_tolerance_plus': 1000,
+})
+
+# Decimal places each configuration counter resolves to (log10 of its scale)
+CONFIGURATION_DECIMALS = MappingProxyType({
+    'weld_time': 2,
+    'pulse_energy': 1,
+    'cool_time': 2,
+    'presence_height': 3,
+    'boss_tolerance_minus': 3,
+    'boss_tolerance_plus': 3,
+})
+
+# Precomputed address tables
+# The schema is static, so every helper below resolves to a single lookup.
+TIP_ADDRESSES = MappingProxyType({
+    (tip, parameter): base + offset
+    for tip, base in TIP_BASE_ADDRESSES.items()
+    for parameter, offset in TIP_OFFSET.items()
+})
+WORK_POSITION_TIP_ADDRESSES = MappingProxyType({
+    tip: WORK_POSITION_TIP_BASE + (tip - 1) * WORK_POSITION_TIP_OFFSET for tip in range(1, 9)
+})
+MANUAL_HEATING_BUTTON_ADDRESSES = MappingProxyType({
+    tip: MANUAL_CONTROLS['heating_button_1'] + (tip - 1) for tip in range(1, 9)
+})
+HEATING_ENERGY_ADDRESSES = MappingProxyType({
+    tip: HEATING_ENERGY_BASE + (tip - 1) * HEATING_ENERGY_OFFSET for tip in range(1, 9)
+})
+HEATING_DISTANCE_ADDRESSES = MappingProxyType({
+    tip: HEATING_DISTANCE_BASE + (tip - 1) * HEATING_DISTANCE_OFFSET for tip in range(1, 9)
+})
+HEATING_HEAT_START_DELAY_ADDRESSES = MappingProxyType({
+    tip: HEATING_HEAT_START_DELAY_BASE + (tip - 1) * HEATING_HEAT_START_DELAY_OFFSET
+    for tip in range(1, 9)
+})
+CONFIGURATION_ADDRESSES = MappingProxyType({
+    name: CONFIGURATION_BASE + offset for name, offset in CONFIGURATION_OFFSETS.items()
+})
+
+# Frequently used addresses as plain module-level ints for hot paths.
+# Per-tip tuples are indexed by tip_number - 1.
+PROG_HOME = PROGRESS_STATES['home']
+GENERAL_TIME_MINUTES = GENERAL_UI['time_minutes']
+BANNER_TEXT = TEXT_STRINGS['banner_text']
+WP_CURRENT_POSITION = WORK_POSITION['current_position']
+WP_SETPOINT = WORK_POSITION['setpoint']
+WP_SPEED_MODE = WORK_POSITION['speed_mode']
+WP_UP_BUTTON = WORK_POSITION['up_button_state']
+WP_DOWN_BUTTON = WORK_POSITION['down_button_state']
+WP_SET_POSITION_CMD = WORK_POSITION['set_position_cmd']
+MANUAL_COOLING = MANUAL_CONTROLS['cooling_button']
+TIP_ACTIVE = tuple(TIP_ADDRESSES[(tip, 'active')] for tip in range(1, 9))
+MANUAL_HEATING_BUTTONS = tuple(MANUAL_HEATING_BUTTON_ADDRESSES[tip] for tip in range(1, 9))
+HEATING_ENERGY = tuple(HEATING_ENERGY_ADDRESSES[tip] for tip in range(1, 9))
 
 # Helper functions for address calculation
 def get_tip_address(tip_number, parameter):
     """Get the Modbus address for a specific tip parameter"""
-    if tip_number not in TIP_BASE_ADDRESSES:
-        raise ValueError(f"Invalid tip number: {tip_number}")
-    if parameter not in TIP_OFFSET:
-        raise ValueError(f"Invalid parameter: {parameter}")
-    
-    return TIP_BASE_ADDRESSES[tip_number] + TIP_OFFSET[parameter]
+    try:
+        return TIP_ADDRESSES[(tip_number, parameter)]
+    except KeyError:
+        if tip_number not in TIP_BASE_ADDRESSES:
+            raise ValueError(f"Invalid tip number: {tip_number}") from None
+        raise ValueError(f"Invalid parameter: {parameter}") from None
 
 def get_progress_address(state_name):
     """Get the Modbus address for a progress state"""
-    if state_name not in PROGRESS_STATES:
-        raise ValueError(f"Invalid progress state: {state_name}")
-    return PROGRESS_STATES[state_name]
+    try:
+        return PROGRESS_STATES[state_name]
+    except KeyError:
+        raise ValueError(f"Invalid progress state: {state_name}") from None
 
 def get_general_ui_address(parameter):
     """Get the Modbus address for general UI parameters"""
-    if parameter not in GENERAL_UI:
-        raise ValueError(f"Invalid general UI parameter: {parameter}")
-    return GENERAL_UI[parameter]
+    try:
+        return GENERAL_UI[parameter]
+    except KeyError:
+        raise ValueError(f"Invalid general UI parameter: {parameter}") from None
 
 def get_monitor_address(parameter):
     """Get the Modbus address for monitor screen parameters"""
-    if parameter not in MONITOR_STATUS:
-        raise ValueError(f"Invalid monitor parameter: {parameter}")
-    return MONITOR_STATUS[parameter]
+    try:
+        return MONITOR_STATUS[parameter]
+    except KeyError:
+        raise ValueError(f"Invalid monitor parameter: {parameter}") from None
 
 def get_work_position_address(parameter):
     """Get the Modbus address for work position parameters"""
-    if parameter not in WORK_POSITION:
-        raise ValueError(f"Invalid work position parameter: {parameter}")
-    return WORK_POSITION[parameter]
+    try:
+        return WORK_POSITION[parameter]
+    except KeyError:
+        raise ValueError(f"Invalid work position parameter: {parameter}") from None
 
 def get_work_position_tip_distance_address(tip_number):
     """Get the Modbus address for work position tip distance"""
-    if not 1 <= tip_number <= 8:
-        raise ValueError(f"Invalid tip number: {tip_number}")
-    return WORK_POSITION_TIP_BASE + (tip_number - 1) * WORK_POSITION_TIP_OFFSET
+    try:
+        return WORK_POSITION_TIP_ADDRESSES[tip_number]
+    except KeyError:
+        raise ValueError(f"Invalid tip number: {tip_number}") from None
 
 def get_manual_heating_button_address(tip_number):
     """Get the Modbus address for a manual heating button state (1..8)"""
-    if not 1 <= tip_number <= 8:
-        raise ValueError(f"Invalid tip number: {tip_number}")
-    return MANUAL_CONTROLS['heating_button_1'] + (tip_number - 1)
+    try:
+        return MANUAL_HEATING_BUTTON_ADDRESSES[tip_number]
+    except KeyError:
+        raise ValueError(f"Invalid tip number: {tip_number}") from None
 
 def get_manual_cooling_address():
     """Get the Modbus address for the manual cooling button state"""
@@ -201,27 +311,31 @@ def get_manual_cooling_address():
 
 def get_heating_energy_address(tip_number):
     """Get the Modbus address for heating energy setpoint"""
-    if not 1 <= tip_number <= 8:
-        raise ValueError(f"Invalid tip number: {tip_number}")
-    return HEATING_ENERGY_BASE + (tip_number - 1) * HEATING_ENERGY_OFFSET
+    try:
+        return HEATING_ENERGY_ADDRESSES[tip_number]
+    except KeyError:
+        raise ValueError(f"Invalid tip number: {tip_number}") from None
 
 def get_heating_distance_address(tip_number):
     """Get the Modbus address for heating distance setpoint"""
-    if not 1 <= tip_number <= 8:
-        raise ValueError(f"Invalid tip number: {tip_number}")
-    return HEATING_DISTANCE_BASE + (tip_number - 1) * HEATING_DISTANCE_OFFSET
+    try:
+        return HEATING_DISTANCE_ADDRESSES[tip_number]
+    except KeyError:
+        raise ValueError(f"Invalid tip number: {tip_number}") from None
 
 def get_heating_heat_start_delay_address(tip_number):
     """Get the Modbus address for heating heat start delay setpoint"""
-    if not 1 <= tip_number <= 8:
-        raise ValueError(f"Invalid tip number: {tip_number}")
-    return HEATING_HEAT_START_DELAY_BASE + (tip_number - 1) * HEATING_HEAT_START_DELAY_OFFSET
+    try:
+        return HEATING_HEAT_START_DELAY_ADDRESSES[tip_number]
+    except KeyError:
+        raise ValueError(f"Invalid tip number: {tip_number}") from None
 
 def get_configuration_address(parameter_name):
     """Get the Modbus address for a configuration counter"""
-    if parameter_name not in CONFIGURATION_OFFSETS:
-        raise ValueError(f"Invalid configuration parameter: {parameter_name}")
-    return CONFIGURATION_BASE + CONFIGURATION_OFFSETS[parameter_name]
+    try:
+        return CONFIGURATION_ADDRESSES[parameter_name]
+    except KeyError:
+        raise ValueError(f"Invalid configuration parameter: {parameter_name}") from None
 
 # Data conversion helpers
 def float_to_registers(value, scale=1000):
@@ -231,30 +345,38 @@ def float_to_registers(value, scale=1000):
     low = scaled & 0xFFFF
     return [high, low]
 
-def registers_to_float(registers, scale=1000):
-    """Convert 2 registers to float with scaling"""
-    value = (registers[0] << 16) | registers[1]
+def registers_to_float(registers, scale=1000, offset=0):
+    """Convert 2 registers (starting at offset) to float with scaling"""
+    value = (registers[offset] << 16) | registers[offset + 1]
     return value / scale
 
+@lru_cache(maxsize=None)
+def _u16_struct(count):
+    """Compiled big-endian struct for count 16-bit registers"""
+    return struct.Struct(f'>{count}H')
+
+@lru_cache(maxsize=None)
+def _u32_struct(count):
+    """Compiled big-endian struct for count unsigned 32-bit values"""
+    return struct.Struct(f'>{count}I')
+
+def registers_to_floats(registers, scale=1000):
+    """Convert a register array (2 per value, 32-bit) to floats with scaling"""
+    count = len(registers) // 2
+    ints = _u32_struct(count).unpack(_u16_struct(2 * count).pack(*registers[:2 * count]))
+    return [i / scale for i in ints]
+
 def string_to_registers(text, max_length=40):
     """Convert string to register array (2 chars per register)"""
-    text = text[:max_length].ljust(max_length, '\0')
-    registers = []
-    for i in range(0, len(text), 2):
-        char1 = ord(text[i]) if i < len(text) else 0
-        char2 = ord(text[i+1]) if i+1 < len(text) else 0
-        registers.append((char1 << 8) | char2)
-    return registers
+    data = text[:max_length].encode('latin-1', 'replace')
+    data = data.ljust(max_length + (max_length & 1), b'\0')
+    return list(_u16_struct(len(data) // 2).unpack(data))
 
 def registers_to_string(registers):
     """Convert register array to string"""
-    text = ""
-    for reg in registers:
-        char1 = (reg >> 8) & 0xFF
-        char2 = reg & 0xFF
-        if char1: text += chr(char1)
-        if char2: text += chr(char2)
-    return text.rstrip('\0')
+    # Mask to 16 bits like the per-byte decoder did, so out-of-range values can't raise
+    data = _u16_struct(len(registers)).pack(*[reg & 0xFFFF for reg in registers])
+    return data.replace(b'\0', b'').decode('latin-1')
 
 # Packet definitions for efficient reading
 MODBUS_READ_PACKETS = [
@@ -306,4 +428,25 @@ MODBUS_READ_PACKETS = [
 
     # Packet 20: Manual controls (allocate 16 registers for future-proofing)
     {'name': 'manual_controls', 'start': 1900, 'count': 16},
-]
\ No newline at end of file
+]
+
+# Maximum registers in one Write Multiple Registers (FC16) request
+MAX_WRITE_COUNT = 123
+
+def coalesce_write_packets(writes, max_count=MAX_WRITE_COUNT):
+    """Merge writes to adjacent registers into as few requests as possible.
+
+    writes is an iterable of non-overlapping (start, values) pairs. Writes are
+    only merged when exactly adjacent (registers in a gap are never written)
+    and the merged request stays within max_count. Returns a list of
+    (start, values) in address order.
+    """
+    coalesced = []
+    for start, values in sorted(writes, key=lambda w: w[0]):
+        if coalesced:
+            last_start, last_values = coalesced[-1]
+            if start == last_start + len(last_values) and len(last_values) + len(values) <= max_count:
+                last_values.extend(values)
+                continue
+        coalesced.append((start, list(values)))
+    return coalesced
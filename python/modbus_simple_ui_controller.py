@@ -7,21 +7,79 @@ This extends the simple UI controller to read values from a Modbus slave
 instead of using internal values.
 """
 
+import argparse
 import asyncio
+import functools
 import websockets
 import json
+import logging
 import time
 from datetime import datetime
 from pymodbus.client import AsyncModbusSerialClient
+from pymodbus.exceptions import ConnectionException, ModbusIOException
 from pymodbus.transaction import ModbusRtuFramer
 
 from modbus_map import *
 import websockets.exceptions
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
 import os
 
+log = logging.getLogger(__name__)
+
+try:
+    import orjson  # Optional C JSON codec, noticeably faster on the 50Hz send path
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(message):
+        # Payloads use int tip numbers as dict keys
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    _loads = orjson.loads
+else:
+    _dumps = json.JSONEncoder(separators=(',', ':')).encode
+    _loads = json.loads
+
+# Tip active states shared with the Electron app (repo root, next to main.js)
+_TIP_STATES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tip_states.json')
+
+def _read_tip_states():
+    """Read and parse tip_states.json, or None if it doesn't exist (blocking - run in an executor)"""
+    if not os.path.exists(_TIP_STATES_PATH):
+        return None
+    with open(_TIP_STATES_PATH, 'rb') as f:
+        return _loads(f.read())
+
+# Exceptions from a read that mean the slave is unreachable rather than one bad region
+_TRANSPORT_ERRORS = (ModbusIOException, ConnectionException, asyncio.TimeoutError)
+
+# Progress state register values (0=inactive, 1=active, 2=done), indexed by value
+_STATE_NAMES = ('inactive', 'active', 'done')
+
+# Progress steps in register order (PROG_HOME + 0..5), as keyed in update_progress_states
+_PROGRESS_STEPS = ('home', 'work_position', 'encoder_zero', 'heat', 'cool', 'cycle_complete')
+
+# Regions polled by read_modbus_data, in bus order: (region, start, count, *parser args).
+# Each region is parsed by the controller's _parse_<region> method.
+# Tip reads skip the active register at offset 0 - active state comes from the JSON file.
+READ_PLAN = (
+    *(('tip', TIP_BASE_ADDRESSES[i] + 1, 4, i) for i in range(1, 9)),
+    ('progress_states', PROG_HOME, 6),
+    ('general_ui', GENERAL_TIME_MINUTES, 9),  # General UI + monitor status (1100-1108)
+    ('text', BANNER_TEXT, 40),  # Banner + processing text (1200-1239)
+    ('work_position', WP_CURRENT_POSITION, 8),
+    ('work_position_tips', WORK_POSITION_TIP_BASE, 16),
+    ('heating_energy', HEATING_ENERGY_BASE, 16),
+    ('heating_distance', HEATING_DISTANCE_BASE, 16),
+    ('heating_heat_start_delay', HEATING_HEAT_START_DELAY_BASE, 16),
+)
+
 class ModbusSimpleUSHSController:
-    def __init__(self, serial_port='/tmp/vserial1', baudrate=1000000, slave_id=1):
+    def __init__(self, serial_port='/tmp/vserial1', baudrate=1000000, slave_id=1,
+                 update_hz=50, heartbeat_hz=0.5):
         """Initialize the Modbus UI controller"""
+        if update_hz <= 0 or heartbeat_hz <= 0:
+            raise ValueError(f"update_hz and heartbeat_hz must be > 0, got {update_hz}, {heartbeat_hz}")
         self.websocket = None
         self.connected = False
         
@@ -37,50 +95,132 @@ class ModbusSimpleUSHSController:
         self.slave_id = slave_id
         self.modbus_client = None
         
+        # WebSocket keepalive (seconds). A ping timeout closes the connection and ends
+        # run_update_loop, and main() does not reconnect, so keep these generous
+        self.ws_ping_interval = 20.0
+        self.ws_ping_timeout = 20.0
+        
+        # RTU is half-duplex with no transaction ids: one request on the bus at a time
+        self._bus_lock = asyncio.Lock()
+        
+        # Client request methods with the slave id bound (see _bind_modbus)
+        self._read_registers = None
+        self._write_register = None
+        self._write_registers = None
+        
         # Update rate
-        self.update_interval = 0.02  # 20ms (50Hz) for maximum responsiveness
+        self.update_interval = 1.0 / update_hz  # 20ms (50Hz) by default for maximum responsiveness
+        self.max_idle_interval = 0.25  # Back off to this when nothing changes
+        self._idle_ticks = 0
+        self._changed_this_tick = False
         
         # Cache for previous values to detect changes
         self.previous_values = {}
         
+        # Messages queued during an update tick, sent as one batch frame
+        self._outbox = []
+        
+        # Last snapshots sent in modbus_update / work_position_update (see update_changed_values)
+        self._prev_tips_snapshot = None
+        self._prev_work_position_snapshot = None
+        self._prev_state_snapshot = None
+        self._prev_progress_snapshot = None
+        self._prev_heating_snapshot = None
+        self._prev_monitor_snapshot = None
+        self._prev_manual_snapshot = None
+        self._manual_controls_tick = 0
+        
+        # Serialized send_all_current_values frame and the state it was built from
+        self._init_snapshot_frame = None
+        self._init_snapshot_state = None
+        
         # Button state tracking for immediate writes
-        self.button_write_queue = asyncio.Queue()
+        # Bounded so a stalled link can't build up a backlog of stale presses
+        self.button_write_queue = asyncio.Queue(maxsize=8)
+        self._wake = asyncio.Event()  # Set after a button write to poll immediately
+        self._inflight = set()  # Button write types currently being written
+        self._mismatch_streak = {'up': 0, 'down': 0, 'speed_mode': 0}  # Consecutive mismatched polls
+        self.mismatch_rewrite_streak = 2
         self.last_button_states = {
             'up': False,
             'down': False,
             'speed_mode': 0
         }
 
+        # Setpoint/configuration register writes, merged by process_register_writes
+        self.register_write_queue = asyncio.Queue()
+        self.write_coalesce_window = 0.005  # Seconds to let a burst of UI edits gather
+        
         # Manual controls cache
         self.manual_heating_buttons = {i: False for i in range(1, 9)}
         self.manual_cooling_on = False
         self.manual_platen_mm = 0.0
         
+        # UI message type -> handler (see handle_incoming_message)
+        self._message_handlers = {
+            'set_speed_mode': self._handle_set_speed_mode,
+            'button_press': self._handle_button_press,
+            'set_work_position': self._handle_set_work_position,
+            'manual_heat_button': self._handle_manual_heat_button,
+            'manual_cooling': self._handle_manual_cooling,
+            'request_all_values': self._handle_request_all_values,
+            'request_work_position_state': self._handle_request_work_position_state,
+            'update_tip_active': self._handle_update_tip_active,
+            'update_heating_energy': self._handle_update_heating_energy,
+            'update_heating_distance': self._handle_update_heating_distance,
+            'update_heating_heat_start_delay': self._handle_update_heating_heat_start_delay,
+            'update_configuration': self._handle_update_configuration,
+            'request_heating_values': self._handle_request_heating_values,
+        }
+        
+        # Heating setpoint blocks change rarely (our writes, or the slave resetting
+        # them), so they are re-read when dirty or every setpoint_revalidate_interval
+        # seconds; request_heating_values forces a re-read
+        self.setpoint_revalidate_interval = 5.0
+        self._dirty = {
+            'heating_energy': True,
+            'heating_distance': True,
+            'heating_heat_start_delay': True
+        }
+        self._last_full_read = {region: 0.0 for region in self._dirty}
+        self._dirty_ranges = [
+            (region, start, start + count) for region, start, count, *_ in READ_PLAN
+            if region in self._dirty
+        ]
+        
+        # READ_PLAN with each region bound to its parser
+        self._read_plan = [
+            (region, start, count, functools.partial(getattr(self, f'_parse_{region}'), *args))
+            for region, start, count, *args in READ_PLAN
+        ]
+        
         # Initialize all properties with default values
+        # (tip active states are loaded from the JSON file in connect)
         self._initialize_properties()
         
-        # Load tip states from JSON file
-        self._load_tip_states_from_json()
+        # Periodic tip state sync; time-based so idle back-off doesn't stretch it
+        self.heartbeat_period = 1.0 / heartbeat_hz  # 2 seconds by default
+        self._next_heartbeat = time.monotonic() + self.heartbeat_period
         
-        # Heartbeat counter for periodic sync
-        self.heartbeat_counter = 0
-        self.heartbeat_interval = 100  # Every 100 cycles (2 seconds at 50Hz)
+        # Banner/processing text changes rarely, so it is polled on a slower cadence
+        # (time-based so idle back-off doesn't stretch it)
+        self.text_read_period = 0.5
+        self._next_text_read = 0.0  # Read on the first poll
         
-    def _load_tip_states_from_json(self):
-        """Load tip active states from tip_states.json"""
+    async def _load_tip_states_from_json(self):
+        """Load tip active states from tip_states.json without blocking the event loop"""
         try:
-            json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'tip_states.json')
-            if os.path.exists(json_path):
-                with open(json_path, 'r') as f:
-                    tip_states = json.load(f)
-                    for i in range(1, 9):
-                        if str(i) in tip_states:
-                            setattr(self, f'tip{i}_active', tip_states[str(i)].get('active', False))
-                            print(f"Loaded tip {i} active state: {tip_states[str(i)].get('active', False)}")
+            loop = asyncio.get_running_loop()
+            tip_states = await loop.run_in_executor(None, _read_tip_states)
+            if tip_states is not None:
+                for i in range(1, 9):
+                    if str(i) in tip_states:
+                        self.tip_active[i] = tip_states[str(i)].get('active', False)
+                log.info("Loaded tip active states: %s", dict(enumerate(self.tip_active[1:], start=1)))
             else:
-                print("tip_states.json not found, using defaults")
+                log.info("tip_states.json not found, using defaults")
         except Exception as e:
-            print(f"Error loading tip states from JSON: {e}")
+            log.error("Error loading tip states from JSON: %s", e)
     
     async def write_initial_tip_states(self):
         """Write initial tip active states from JSON to Modbus slave"""
@@ -88,20 +228,20 @@ class ModbusSimpleUSHSController:
             return
             
         try:
-            print("Writing initial tip active states to Modbus slave...")
+            log.info("Writing initial tip active states to Modbus slave...")
             for i in range(1, 9):
-                addr = get_tip_address(i, 'active')
-                active_state = getattr(self, f'tip{i}_active', False)
+                addr = TIP_ACTIVE[i - 1]
+                active_state = self.tip_active[i]
                 value = 1 if active_state else 0
                 
-                result = await self.modbus_client.write_register(addr, value, slave=self.slave_id)
+                result = await self._write_register(addr, value)
                 if result.isError():
-                    print(f"Error writing initial tip {i} active state to Modbus: {result}")
+                    log.warning("Error writing initial tip %d active state to Modbus: %s", i, result)
                 else:
-                    print(f"Successfully wrote initial tip {i} active state {value} to Modbus address {addr}")
+                    log.info("Successfully wrote initial tip %d active state %d to Modbus address %d", i, value, addr)
                     
         except Exception as e:
-            print(f"Error writing initial tip states to Modbus: {e}")
+            log.error("Error writing initial tip states to Modbus: %s", e)
     
     async def _heartbeat_sync_tip_states(self):
         """Periodically sync all tip active states to ensure reliability"""
@@ -111,26 +251,42 @@ class ModbusSimpleUSHSController:
         try:
             # Write all tip active states as a heartbeat sync
             for i in range(1, 9):
-                addr = get_tip_address(i, 'active')
-                active_state = getattr(self, f'tip{i}_active', False)
+                addr = TIP_ACTIVE[i - 1]
+                active_state = self.tip_active[i]
                 value = 1 if active_state else 0
                 
-                result = await self.modbus_client.write_register(addr, value, slave=self.slave_id)
+                result = await self._write_register(addr, value)
                 if result.isError():
-                    print(f"Heartbeat sync error for tip {i}: {result}")
+                    log.warning("Heartbeat sync error for tip %d: %s", i, result)
                     
-            print("Heartbeat sync of tip active states completed")
+            log.debug("Heartbeat sync of tip active states completed")
         except Exception as e:
-            print(f"Error in heartbeat sync: {e}")
+            log.error("Error in heartbeat sync: %s", e)
         
     def _initialize_properties(self):
         """Initialize all UI properties"""
-        # Tips (1-8)
+        # Tips (1-8), one list per field; index 0 is unused so tip numbers index directly
+        self.tip_active = [False] * 9
+        self.tip_progress = [0] * 9
+        self.tip_joules = [0.0] * 9
+        self.tip_distance = [0.0] * 9
+            
+        # Per-tip change-detection keys and element IDs, built once instead of every tick.
+        # Tips 1-4 use the -active joules/distance elements, tips 5-8 always -in-active;
+        # only tips 1-4 switch their progress bar element with the active state.
+        self._tip_ids = {}
         for i in range(1, 9):
-            setattr(self, f'tip{i}_active', False)
-            setattr(self, f'tip{i}_progress', 0)
-            setattr(self, f'tip{i}_joules', 0.0)
-            setattr(self, f'tip{i}_distance', 0.0)
+            suffix = 'active' if i <= 4 else 'in-active'
+            self._tip_ids[i] = {
+                'active_key': f'tip{i}_active',
+                'progress_key': f'tip{i}_progress',
+                'joules_key': f'tip{i}_joules',
+                'distance_key': f'tip{i}_distance',
+                'progress_active': f'tip-{i}-progress-{suffix}',
+                'progress_inactive': f'tip-{i}-progress-in-active',
+                'joules': f'tip-{i}-joules-{suffix}',
+                'distance': f'tip-{i}-distance-{suffix}',
+            }
             
         # Progress states
         self.progress_home = 'inactive'
@@ -180,221 +336,204 @@ class ModbusSimpleUSHSController:
                 **self.serial_config,
                 framer=ModbusRtuFramer
             )
+            self._bind_modbus()
             
             connected = await self.modbus_client.connect()
             if connected:
-                print(f"✅ Connected to Modbus slave on {self.serial_config['port']}")
-                print(f"🔗 Using slave ID: {self.slave_id}")
+                log.info("✅ Connected to Modbus slave on %s", self.serial_config['port'])
+                log.info("🔗 Using slave ID: %s", self.slave_id)
                 
                 # Test write to verify connection
-                test_addr = get_heating_energy_address(1)  # Should be 1500
+                test_addr = HEATING_ENERGY[0]  # Should be 1500
                 test_high, test_low = float_to_registers(99.9, scale=10)
-                print(f"🧪 Test write to addr {test_addr}: high={test_high}, low={test_low}")
-                test_result = await self.modbus_client.write_registers(test_addr, [test_high, test_low], slave=self.slave_id)
+                log.info("🧪 Test write to addr %d: high=%d, low=%d", test_addr, test_high, test_low)
+                test_result = await self._write_registers(test_addr, [test_high, test_low])
+                self._mark_dirty(test_addr, 2)
                 if test_result.isError():
-                    print(f"❌ Test write failed: {test_result}")
+                    log.warning("❌ Test write failed: %s", test_result)
                 else:
-                    print(f"✅ Test write successful!")
+                    log.info("✅ Test write successful!")
                 
                 # Write initial tip active states from JSON to Modbus slave
                 await self.write_initial_tip_states()
                 
                 return True
             else:
-                print(f"❌ Failed to connect to Modbus slave on {self.serial_config['port']}")
+                log.error("❌ Failed to connect to Modbus slave on %s", self.serial_config['port'])
                 return False
                 
         except Exception as e:
-            print(f"Modbus connection error: {e}")
+            log.error("Modbus connection error: %s", e)
             return False
             
+    def _bind_modbus(self):
+        """Bind the current client's request methods to our slave id and the bus lock"""
+        client = self.modbus_client
+        self._read_registers = functools.partial(self._locked_request, client.read_holding_registers)
+        self._write_register = functools.partial(self._locked_request, client.write_register)
+        self._write_registers = functools.partial(self._locked_request, client.write_registers)
+        
+    async def _locked_request(self, request, address, value):
+        """Issue one Modbus request while holding the bus lock"""
+        async with self._bus_lock:
+            return await request(address, value, slave=self.slave_id)
+        
     async def disconnect_modbus(self):
         """Disconnect from Modbus slave"""
         if self.modbus_client:
             self.modbus_client.close()
-            print("Disconnected from Modbus slave")
+            log.info("Disconnected from Modbus slave")
             
-    async def read_modbus_data(self):
-        """Read all data from Modbus slave"""
+    async def read_modbus_data(self, force_text=False):
+        """Read all data from Modbus slave
+
+        Regions are read in READ_PLAN order; a region with an error response or
+        unparseable registers is skipped without aborting the rest, but a
+        transport failure (no response, port gone) ends the sweep. Returns True
+        if at least one region was parsed. Text strings are only re-read every
+        text_read_period seconds unless force_text is set, and heating
+        setpoint blocks only when dirty or due for revalidation.
+        """
         if not self.modbus_client:
             return False
             
-        try:
-            # Read tips data
-            for i in range(1, 9):
-                base_addr = TIP_BASE_ADDRESSES[i]
-                
-                # Read 4 registers for each tip (progress, joules, distance[2])
-                # NOTE: Active state is NOT read from Modbus - it comes from JSON file
-                # Skip the active register at offset 0, start from offset 1 (progress)
-                result = await self.modbus_client.read_holding_registers(
-                    base_addr + 1, 4, slave=self.slave_id
-                )
-                
-                if not result.isError():
-                    # Parse tip data (skipping active state)
-                    # DO NOT set tip active state from Modbus
-                    setattr(self, f'tip{i}_progress', result.registers[0])  # Progress
-                    setattr(self, f'tip{i}_joules', result.registers[1] / 10.0)  # Joules
-                    
-                    # Distance is 32-bit (2 registers)
-                    distance = registers_to_float([result.registers[2], result.registers[3]], 1000)
-                    setattr(self, f'tip{i}_distance', distance)
-                    
-            # Read progress states
-            result = await self.modbus_client.read_holding_registers(
-                PROGRESS_STATES['home'], 6, slave=self.slave_id
-            )
-            
-            if not result.isError():
-                state_map = {0: 'inactive', 1: 'active', 2: 'done'}
-                self.progress_home = state_map.get(result.registers[0], 'inactive')
-                self.progress_work_position = state_map.get(result.registers[1], 'inactive')
-                self.progress_encoder_zero = state_map.get(result.registers[2], 'inactive')
-                self.progress_heat = state_map.get(result.registers[3], 'inactive')
-                self.progress_cool = state_map.get(result.registers[4], 'inactive')
-                self.progress_cycle_complete = state_map.get(result.registers[5], 'inactive')
-                
-            # Read general UI
-            result = await self.modbus_client.read_holding_registers(
-                GENERAL_UI['time_minutes'], 3, slave=self.slave_id
-            )
-            
-            if not result.isError():
-                self.time_minutes = result.registers[0]
-                self.time_seconds = result.registers[1]
-                self.slider_percentage = result.registers[2]
-                
-            # Read banner text
-            result = await self.modbus_client.read_holding_registers(
-                TEXT_STRINGS['banner_text'], 20, slave=self.slave_id
-            )
-            
-            if not result.isError():
-                text = registers_to_string(result.registers)
-                if text.strip():  # Only update if not empty
-                    self.banner_text = text
-                
-            # Read processing text
-            result = await self.modbus_client.read_holding_registers(
-                TEXT_STRINGS['processing_text'], 20, slave=self.slave_id
-            )
-            
-            if not result.isError():
-                text = registers_to_string(result.registers)
-                if text.strip():  # Only update if not empty
-                    self.processing_text = text
-            
-            # Read work position data
-            result = await self.modbus_client.read_holding_registers(
-                WORK_POSITION['current_position'], 8, slave=self.slave_id
-            )
-            
-            if not result.isError():
-                # Current position (2 registers, 32-bit)
-                self.current_position = registers_to_float([result.registers[0], result.registers[1]], 100)
-                
-                # Setpoint (2 registers, 32-bit)
-                self.setpoint = registers_to_float([result.registers[2], result.registers[3]], 100)
-                
-                # Speed mode (1 register)
-                self.speed_mode = result.registers[4]
-                
-                # Button states (1 register each)
-                self.up_button_state = bool(result.registers[5])
-                self.down_button_state = bool(result.registers[6])
-            
-            # Read work position tip distances
-            result = await self.modbus_client.read_holding_registers(
-                WORK_POSITION_TIP_BASE, 16, slave=self.slave_id  # 8 tips * 2 registers each
-            )
-            
-            if not result.isError():
-                for i in range(1, 9):
-                    base_idx = (i - 1) * 2
-                    distance = registers_to_float(
-                        [result.registers[base_idx], result.registers[base_idx + 1]], 100
-                    )
-                    self.work_tip_distances[i] = distance
-                    
-            # Read heating energy setpoints
-            result = await self.modbus_client.read_holding_registers(
-                HEATING_ENERGY_BASE, 16, slave=self.slave_id  # 8 tips * 2 registers each
-            )
+        now = time.monotonic()
+        read_text = force_text or now >= self._next_text_read
+        if read_text:
+            self._next_text_read = now + self.text_read_period
             
-            if not result.isError():
-                for i in range(1, 9):
-                    base_idx = (i - 1) * 2
-                    energy = registers_to_float(
-                        [result.registers[base_idx], result.registers[base_idx + 1]], 10
-                    )
-                    self.heating_energy_setpoints[i] = energy
-                    
-            # Read heating distance setpoints
-            result = await self.modbus_client.read_holding_registers(
-                HEATING_DISTANCE_BASE, 16, slave=self.slave_id  # 8 tips * 2 registers each
-            )
-            
-            if not result.isError():
-                for i in range(1, 9):
-                    base_idx = (i - 1) * 2
-                    distance = registers_to_float(
-                        [result.registers[base_idx], result.registers[base_idx + 1]], 1000
-                    )
-                    self.heating_distance_setpoints[i] = distance
-            
-            # Read heating heat start delay setpoints
-            result = await self.modbus_client.read_holding_registers(
-                HEATING_HEAT_START_DELAY_BASE, 16, slave=self.slave_id  # 8 tips * 2 registers each
-            )
-            
-            if not result.isError():
-                for i in range(1, 9):
-                    base_idx = (i - 1) * 2
-                    heat_start_delay = registers_to_float(
-                        [result.registers[base_idx], result.registers[base_idx + 1]], 1000
-                    )
-                    self.heating_heat_start_delay_setpoints[i] = heat_start_delay
-
-            # Read monitor screen registers
+        any_read = False
+        failed = []
+        for region, start, count, parse in self._read_plan:
+            if region == 'text' and not read_text:
+                continue
+            if (region in self._dirty and not self._dirty[region]
+                    and now - self._last_full_read[region] < self.setpoint_revalidate_interval):
+                continue
             try:
-                result = await self.modbus_client.read_holding_registers(
-                    get_monitor_address('pressure_psi'), 6, slave=self.slave_id
-                )
-                if not result.isError():
-                    self.monitor_pressure_psi = int(result.registers[0])
-                    self.monitor_left_start = bool(result.registers[1])
-                    self.monitor_right_start = bool(result.registers[2])
-                    self.monitor_estop_active = bool(result.registers[3])
-                    self.monitor_home_switch = bool(result.registers[4])
-                    self.monitor_pressure_ok = bool(result.registers[5])
+                result = await self._read_registers(start, count)
+            except _TRANSPORT_ERRORS as e:
+                # The slave isn't answering: every remaining region would time out
+                # too, each holding the bus lock through its retries
+                failed.append(f"{region}@{start}: {e}")
+                log.warning("Error reading Modbus data: %s", '; '.join(failed))
+                return False
+            if result.isError():
+                failed.append(f"{region}@{start}: {result}")
+                continue
+            try:
+                parse(result.registers)
             except Exception as e:
-                # Non-fatal; continue loop
-                pass
-
-            # Note: manual controls (heating/cooling button states) are write-only from UI.
-            # We do not read them back to avoid overriding the UI's source of truth.
-            # Platen mm is already read earlier from WORK_POSITION current_position.
+                failed.append(f"{region}@{start}: {e}")
+                continue
+            any_read = True
+            if region in self._dirty:
+                self._dirty[region] = False
+                self._last_full_read[region] = now
                 
-            return True
+        # Note: manual controls (heating/cooling button states) are write-only from UI.
+        # We do not read them back to avoid overriding the UI's source of truth.
+        # Platen mm is already read from WORK_POSITION current_position.
+        
+        if failed:
+            log.warning("Error reading Modbus data: %s", '; '.join(failed))
+        return any_read
+        
+    def _parse_tip(self, i, regs):
+        """Parse progress, joules and distance for tip i (active state is not read)"""
+        self.tip_progress[i] = regs[0]
+        self.tip_joules[i] = regs[1] / 10.0
+        
+        # Distance is 32-bit (2 registers)
+        self.tip_distance[i] = registers_to_float(regs, 1000, 2)
+        
+    def _parse_progress_states(self, regs):
+        """Parse the six progress state registers"""
+        states = [_STATE_NAMES[v] if v < 3 else 'inactive' for v in regs]
+        self.progress_home = states[0]
+        self.progress_work_position = states[1]
+        self.progress_encoder_zero = states[2]
+        self.progress_heat = states[3]
+        self.progress_cool = states[4]
+        self.progress_cycle_complete = states[5]
+        
+    def _parse_general_ui(self, regs):
+        """Parse general UI (time, slider) and monitor status registers"""
+        self.time_minutes = regs[0]
+        self.time_seconds = regs[1]
+        self.slider_percentage = regs[2]
+        
+        self.monitor_pressure_psi = int(regs[3])
+        self.monitor_left_start = bool(regs[4])
+        self.monitor_right_start = bool(regs[5])
+        self.monitor_estop_active = bool(regs[6])
+        self.monitor_home_switch = bool(regs[7])
+        self.monitor_pressure_ok = bool(regs[8])
+        
+    def _parse_text(self, regs):
+        """Parse banner and processing text; empty strings keep the previous text"""
+        text = registers_to_string(regs[:20])
+        if text.strip():
+            self.banner_text = text
             
-        except Exception as e:
-            print(f"Error reading Modbus data: {e}")
-            return False
+        text = registers_to_string(regs[20:40])
+        if text.strip():
+            self.processing_text = text
+            
+    def _parse_work_position(self, regs):
+        """Parse work position, setpoint, speed mode and up/down button states"""
+        # Current position and setpoint (2 registers each, 32-bit)
+        self.current_position = registers_to_float(regs, 100)
+        self.setpoint = registers_to_float(regs, 100, 2)
+        
+        self.speed_mode = regs[4]
+        self.up_button_state = bool(regs[5])
+        self.down_button_state = bool(regs[6])
+        
+    def _parse_work_position_tips(self, regs):
+        """Parse the eight work position tip distances"""
+        self.work_tip_distances.update(enumerate(registers_to_floats(regs, 100), start=1))
+        
+    def _parse_heating_energy(self, regs):
+        """Parse the eight heating energy setpoints"""
+        self.heating_energy_setpoints.update(enumerate(registers_to_floats(regs, 10), start=1))
+        
+    def _parse_heating_distance(self, regs):
+        """Parse the eight heating distance setpoints"""
+        self.heating_distance_setpoints.update(enumerate(registers_to_floats(regs, 1000), start=1))
+        
+    def _parse_heating_heat_start_delay(self, regs):
+        """Parse the eight heating heat start delay setpoints"""
+        self.heating_heat_start_delay_setpoints.update(
+            enumerate(registers_to_floats(regs, 1000), start=1)
+        )
             
     async def connect(self, uri="ws://localhost:8080"):
         """Connect to the Electron app via WebSocket"""
         try:
-            self.websocket = await websockets.connect(uri)
+            # Pings detect a dead Electron app (see ws_ping_interval). Only deltas are
+            # sent after the first tick; pages request a full resync (request_all_values)
+            # Frames are compressed (permessage-deflate) without context takeover,
+            # so neither side keeps a compression window between messages
+            self.websocket = await websockets.connect(
+                uri, ping_interval=self.ws_ping_interval, ping_timeout=self.ws_ping_timeout,
+                extensions=[ClientPerMessageDeflateFactory(
+                    server_no_context_takeover=True,
+                    client_no_context_takeover=True
+                )]
+            )
             self.connected = True
-            print(f"Connected to WebSocket at {uri}")
+            log.info("Connected to WebSocket at %s", uri)
+            
+            # Load tip states from JSON file before they are written to the slave
+            await self._load_tip_states_from_json()
             
             # Also connect to Modbus
             await self.connect_modbus()
             
             return True
         except Exception as e:
-            print(f"Connection failed: {e}")
+            log.error("Connection failed: %s", e)
             self.connected = False
             return False
             
@@ -403,35 +542,66 @@ class ModbusSimpleUSHSController:
         if self.websocket:
             await self.websocket.close()
             self.connected = False
-            print("Disconnected from WebSocket")
+            log.info("Disconnected from WebSocket")
             
         await self.disconnect_modbus()
             
     async def _send_message(self, message_type, **data):
         """Send a message to the Electron app"""
-        if not self.connected or not self.websocket:
-            return False
-            
-        message = {
+        return await self._send_frame({
             "type": message_type,
             **data
-        }
+        })
+        
+    async def _send_frame(self, message):
+        """Serialize and send one message dict over the WebSocket"""
+        return await self._send_serialized(_dumps(message))
         
+    async def _send_serialized(self, frame):
+        """Send an already serialized frame over the WebSocket"""
+        if not self.connected or not self.websocket:
+            return False
+            
         try:
-            await self.websocket.send(json.dumps(message))
+            await self.websocket.send(frame)
             return True
         except Exception as e:
-            print(f"Error sending message: {e}")
+            log.error("Error sending message: %s", e)
             self.connected = False
             return False
             
+    def _queue_message(self, message_type, **data):
+        """Queue a message for the next batch frame (see flush_messages)"""
+        self._outbox.append({
+            "type": message_type,
+            **data
+        })
+        
+    def _serialize_outbox(self):
+        """Serialize and clear the queued messages as one frame (None if nothing is queued)"""
+        if not self._outbox:
+            return None
+        messages, self._outbox = self._outbox, []
+        if len(messages) == 1:
+            return _dumps(messages[0])
+        return _dumps({"type": "batch", "messages": messages})
+        
+    async def flush_messages(self):
+        """Send all queued messages to the Electron app in a single frame"""
+        frame = self._serialize_outbox()
+        if frame is None:
+            return True
+        return await self._send_serialized(frame)
+            
     def _has_value_changed(self, key, value):
         """Check if a value has changed since last update"""
         if key not in self.previous_values:
+            self._changed_this_tick = True
             self.previous_values[key] = value
             return True
             
         if self.previous_values[key] != value:
+            self._changed_this_tick = True
             self.previous_values[key] = value
             return True
             
@@ -439,6 +609,20 @@ class ModbusSimpleUSHSController:
         
     async def send_all_current_values(self):
         """Send all current values to the UI (used on page load/reconnect)"""
+        # Reuse the serialized frame from the last call while the state is unchanged
+        state = self._state_snapshot()
+        if state != self._init_snapshot_state:
+            pending, self._outbox = self._outbox, []
+            self._queue_all_current_values()
+            self._init_snapshot_frame = self._serialize_outbox()
+            self._init_snapshot_state = state
+            self._outbox = pending
+            
+        await self.flush_messages()
+        await self._send_serialized(self._init_snapshot_frame)
+        
+    def _queue_all_current_values(self):
+        """Queue the full set of UI messages for send_all_current_values"""
         # Send critical visible elements first
         
         # 1. Send progress states first (most visible)
@@ -450,479 +634,546 @@ class ModbusSimpleUSHSController:
             'cool': self.progress_cool,
             'cycle_complete': self.progress_cycle_complete
         }
-        await self._send_message("update_progress_states", states=progress_states)
+        self._queue_message("update_progress_states", states=progress_states)
         
         # 2. Send text elements first (most visible)
-        await self._send_message("update_element", 
-                               element_id="home-cycle-progress-text", 
-                               property="textContent", 
-                               value=self.processing_text)
-        
-        await self._send_message("update_element", 
-                               element_id="home-text-percent", 
-                               property="textContent", 
-                               value=f"{self.slider_percentage}%")
-        
-        await self._send_message("update_element", 
-                               element_id="home-text-time", 
-                               property="textContent", 
-                               value=f"∼{self.time_minutes}m {self.time_seconds:02d}sec")
-        
-        await self._send_message("update_element", 
-                               element_id="home-banner-text", 
-                               property="textContent", 
-                               value=self.banner_text)
+        self._queue_message("update_element", 
+                          element_id="home-cycle-progress-text", 
+                          property="textContent", 
+                          value=self.processing_text)
+        
+        self._queue_message("update_element", 
+                          element_id="home-text-percent", 
+                          property="textContent", 
+                          value=f"{self.slider_percentage}%")
+        
+        self._queue_message("update_element", 
+                          element_id="home-text-time", 
+                          property="textContent", 
+                          value=f"∼{self.time_minutes}m {self.time_seconds:02d}sec")
+        
+        self._queue_message("update_element", 
+                          element_id="home-banner-text", 
+                          property="textContent", 
+                          value=self.banner_text)
         
         # 3. Send tip states
+        queue = self._queue_message
+        tip_ids = self._tip_ids
         for i in range(1, 9):
-            await self._send_message("update_tip_state", 
-                                   tip_number=i, 
-                                   is_active=getattr(self, f'tip{i}_active'))
+            ids = tip_ids[i]
+            active = self.tip_active[i]
+            queue("update_tip_state", 
+                tip_number=i, 
+                is_active=active)
             
             # Send progress
-            progress_key = f'tip{i}_progress'
-            if i <= 4:
-                element_id = f"tip-{i}-progress-{'active' if getattr(self, f'tip{i}_active') else 'in-active'}"
-            else:
-                element_id = f"tip-{i}-progress-in-active"
-            await self._send_message("update_progress_bar", 
-                                   element_id=element_id, 
-                                   progress=getattr(self, progress_key))
+            element_id = ids['progress_active'] if active else ids['progress_inactive']
+            queue("update_progress_bar", 
+                element_id=element_id, 
+                progress=self.tip_progress[i])
             
             # Send joules - with correct element IDs
-            joules_text = f"{getattr(self, f'tip{i}_joules'):.1f} J"
-            if i <= 4:
-                # For tips 1-4, always use -active
-                joules_element_id = f"tip-{i}-joules-active"
-            else:
-                # For tips 5-8, always use -in-active
-                joules_element_id = f"tip-{i}-joules-in-active"
-                
-            await self._send_message("update_element", 
-                                   element_id=joules_element_id, 
-                                   property="textContent", 
-                                   value=joules_text)
+            queue("update_element", 
+                element_id=ids['joules'], 
+                property="textContent", 
+                value=f"{self.tip_joules[i]:.1f} J")
             
             # Send distance - with correct element IDs
-            distance_text = f"{getattr(self, f'tip{i}_distance'):.1f} mm"
-            if i <= 4:
-                # For tips 1-4, always use -active
-                distance_element_id = f"tip-{i}-distance-active"
-            else:
-                # For tips 5-8, always use -in-active
-                distance_element_id = f"tip-{i}-distance-in-active"
-                
-            await self._send_message("update_element", 
-                                   element_id=distance_element_id, 
-                                   property="textContent", 
-                                   value=distance_text)
-        
+            queue("update_element", 
+                element_id=ids['distance'], 
+                property="textContent", 
+                value=f"{self.tip_distance[i]:.1f} mm")
+            
     async def update_changed_values(self):
         """Update only values that have changed"""
+        # Fast path: one C-level tuple compare of the whole polled state skips
+        # the per-field diffing when nothing has changed (the common idle case)
+        state = self._state_snapshot()
+        if state != self._prev_state_snapshot:
+            self._prev_state_snapshot = state
+            self._queue_value_changes()
+        
+        # Periodic heartbeat sync of tip active states for reliability
+        now = time.monotonic()
+        if now >= self._next_heartbeat:
+            self._next_heartbeat = now + self.heartbeat_period
+            await self._heartbeat_sync_tip_states()
+
+        # Always forward manual controls snapshot to UI to avoid missed states
+        # Throttle platen updates and avoid flicker by rounding to 0.1mm
+        # Also include up/down states for visual feedback
+        self._manual_controls_tick += 1
+        manual_snapshot = (
+            round(float(self.current_position), 1),
+            bool(self.up_button_state),
+            bool(self.down_button_state)
+        )
+        # Reduce send rate: only send when changed OR every 5 cycles (~10 Hz if base is 50 Hz)
+        manual_changed = manual_snapshot != self._prev_manual_snapshot
+        if manual_changed:
+            self._changed_this_tick = True
+            self._prev_manual_snapshot = manual_snapshot
+        if manual_changed or self._manual_controls_tick % 5 == 0:
+            display_platen, up_pressed, down_pressed = manual_snapshot
+            manual_payload = {
+                'platen_mm': display_platen,
+                'up_pressed': up_pressed,
+                'down_pressed': down_pressed,
+            }
+            self._queue_message("manual_controls_update", payload=manual_payload)
+            
+        await self.flush_messages()
+        
+    def _state_snapshot(self):
+        """Flat tuple of every polled value that _queue_value_changes reports on"""
+        return (
+            *self.tip_active, *self.tip_progress, *self.tip_joules, *self.tip_distance,
+            self.progress_home, self.progress_work_position, self.progress_encoder_zero,
+            self.progress_heat, self.progress_cool, self.progress_cycle_complete,
+            self.time_minutes, self.time_seconds, self.slider_percentage,
+            self.banner_text, self.processing_text,
+            self.current_position, self.setpoint, self.speed_mode,
+            self.up_button_state, self.down_button_state,
+            *self.work_tip_distances.values(),
+            *self.heating_energy_setpoints.values(),
+            *self.heating_distance_setpoints.values(),
+            *self.heating_heat_start_delay_setpoints.values(),
+            self.monitor_pressure_psi, self.monitor_left_start, self.monitor_right_start,
+            self.monitor_estop_active, self.monitor_home_switch, self.monitor_pressure_ok
+        )
+        
+    def _queue_value_changes(self):
+        """Queue UI messages for each polled value that changed since the last report"""
+        # Local aliases for the per-tip loop
+        queue = self._queue_message
+        changed = self._has_value_changed
+        tip_ids = self._tip_ids
+        tip_active = self.tip_active
+        tip_progress = self.tip_progress
+        tip_joules = self.tip_joules
+        tip_distance = self.tip_distance
+        
         # Update tips
         for i in range(1, 9):
+            ids = tip_ids[i]
+            
             # Check active state
-            active_key = f'tip{i}_active'
-            if self._has_value_changed(active_key, getattr(self, active_key)):
-                await self._send_message("update_tip_state", 
-                                       tip_number=i, 
-                                       is_active=getattr(self, active_key))
-                
-                # Also write to Modbus continuously for reliability
-                if self.modbus_client:
-                    try:
-                        addr = get_tip_address(i, 'active')
-                        value = 1 if getattr(self, active_key) else 0
-                        result = await self.modbus_client.write_register(addr, value, slave=self.slave_id)
-                        if result.isError():
-                            print(f"Error writing tip {i} active state to Modbus: {result}")
-                        else:
-                            print(f"Continuously wrote tip {i} active state {value} to Modbus")
-                    except Exception as e:
-                        print(f"Error in continuous tip {i} active write: {e}")
+            active_key = ids['active_key']
+            if changed(active_key, tip_active[i]):
+                queue("update_tip_state", 
+                    tip_number=i, 
+                    is_active=tip_active[i])
                 
             # Check progress
-            progress_key = f'tip{i}_progress'
-            if self._has_value_changed(progress_key, getattr(self, progress_key)):
+            progress_key = ids['progress_key']
+            if changed(progress_key, tip_progress[i]):
                 # For tips 5-8, always use "in-active" in the element ID
-                if i <= 4:
-                    element_id = f"tip-{i}-progress-{'active' if getattr(self, f'tip{i}_active') else 'in-active'}"
-                else:
-                    element_id = f"tip-{i}-progress-in-active"
-                await self._send_message("update_progress_bar", 
-                                       element_id=element_id, 
-                                       progress=getattr(self, progress_key))
+                element_id = ids['progress_active'] if tip_active[i] else ids['progress_inactive']
+                queue("update_progress_bar", 
+                    element_id=element_id, 
+                    progress=tip_progress[i])
                 
             # Check joules
-            joules_key = f'tip{i}_joules'
-            if self._has_value_changed(joules_key, getattr(self, joules_key)):
-                joules_text = f"{getattr(self, joules_key):.1f} J"
-                if i <= 4:
-                    # For tips 1-4, always use -active
-                    element_id = f"tip-{i}-joules-active"
-                else:
-                    # For tips 5-8, always use -in-active
-                    element_id = f"tip-{i}-joules-in-active"
-                    
-                await self._send_message("update_element", 
-                                       element_id=element_id, 
-                                       property="textContent",
-                                       value=joules_text)
+            joules_key = ids['joules_key']
+            if changed(joules_key, tip_joules[i]):
+                joules_text = f"{tip_joules[i]:.1f} J"
+                queue("update_element", 
+                    element_id=ids['joules'], 
+                    property="textContent",
+                    value=joules_text)
                 
             # Check distance
-            distance_key = f'tip{i}_distance'
-            if self._has_value_changed(distance_key, getattr(self, distance_key)):
-                distance_text = f"{getattr(self, distance_key):.1f} mm"
-                if i <= 4:
-                    # For tips 1-4, always use -active
-                    element_id = f"tip-{i}-distance-active"
-                else:
-                    # For tips 5-8, always use -in-active
-                    element_id = f"tip-{i}-distance-in-active"
-                    
-                await self._send_message("update_element", 
-                                       element_id=element_id, 
-                                       property="textContent",
-                                       value=distance_text)
+            distance_key = ids['distance_key']
+            if changed(distance_key, tip_distance[i]):
+                distance_text = f"{tip_distance[i]:.1f} mm"
+                queue("update_element", 
+                    element_id=ids['distance'], 
+                    property="textContent",
+                    value=distance_text)
                 
         # Update progress states
-        progress_map = {
-            'home': self.progress_home,
-            'work_position': self.progress_work_position,
-            'encoder_zero': self.progress_encoder_zero,
-            'heat': self.progress_heat,
-            'cool': self.progress_cool,
-            'cycle_complete': self.progress_cycle_complete
-        }
+        # Compare a flat tuple snapshot; the states dict is only built on change
+        progress_snapshot = (
+            self.progress_home, self.progress_work_position, self.progress_encoder_zero,
+            self.progress_heat, self.progress_cool, self.progress_cycle_complete
+        )
         
-        if self._has_value_changed('progress_states', progress_map):
-            await self._send_message("update_progress_states", states=progress_map)
+        if progress_snapshot != self._prev_progress_snapshot:
+            self._changed_this_tick = True
+            self._prev_progress_snapshot = progress_snapshot
+            progress_map = dict(zip(_PROGRESS_STEPS, progress_snapshot))
+            self._queue_message("update_progress_states", states=progress_map)
             
         # Update time
         time_str = f"∼{self.time_minutes}m {self.time_seconds:02d}sec"
         if self._has_value_changed('time', time_str):
-            await self._send_message("update_element", 
-                                   element_id="home-text-time", 
-                                   property="textContent",
-                                   value=time_str)
+            self._queue_message("update_element", 
+                              element_id="home-text-time", 
+                              property="textContent",
+                              value=time_str)
             
         # Update slider and percentage
         if self._has_value_changed('slider', self.slider_percentage):
-            await self._send_message("update_slider", position=self.slider_percentage)
-            await self._send_message("update_element", 
-                                   element_id="home-text-percent", 
-                                   property="textContent",
-                                   value=f"{self.slider_percentage}%")
+            self._queue_message("update_slider", position=self.slider_percentage)
+            self._queue_message("update_element", 
+                              element_id="home-text-percent", 
+                              property="textContent",
+                              value=f"{self.slider_percentage}%")
             
         # Update banner text
         if self._has_value_changed('banner_text', self.banner_text):
-            await self._send_message("update_element", 
-                                   element_id="home-banner-text", 
-                                   property="textContent",
-                                   value=self.banner_text)
+            self._queue_message("update_element", 
+                              element_id="home-banner-text", 
+                              property="textContent",
+                              value=self.banner_text)
             
         # Update processing text
         if self._has_value_changed('processing_text', self.processing_text):
-            await self._send_message("update_element", 
-                                   element_id="home-cycle-progress-text", 
-                                   property="textContent",
-                                   value=self.processing_text)
+            self._queue_message("update_element", 
+                              element_id="home-cycle-progress-text", 
+                              property="textContent",
+                              value=self.processing_text)
         
         # Update work position data (if on work position screen)
-        work_position_data = {
-            'current_position': self.current_position,
-            'setpoint': self.setpoint,
-            'speed_mode': 'rapid' if self.speed_mode == 0 else 'fine',
-            'up_button': self.up_button_state,
-            'down_button': self.down_button_state,
-            'tip_distances': self.work_tip_distances.copy(),
-            'tip_states': {i: getattr(self, f'tip{i}_active') for i in range(1, 9)}
-        }
+        # Compare a flat tuple snapshot; the payload dict is only built on change
+        speed_mode = 'rapid' if self.speed_mode == 0 else 'fine'
+        work_position_snapshot = (
+            self.current_position, self.setpoint, speed_mode,
+            self.up_button_state, self.down_button_state,
+            *self.work_tip_distances.values(), *self.tip_active[1:]
+        )
         
-        if self._has_value_changed('work_position', work_position_data):
-            await self._send_message("work_position_update", data=work_position_data)
+        if work_position_snapshot != self._prev_work_position_snapshot:
+            self._changed_this_tick = True
+            self._prev_work_position_snapshot = work_position_snapshot
+            work_position_data = {
+                'current_position': self.current_position,
+                'setpoint': self.setpoint,
+                'speed_mode': speed_mode,
+                'up_button': self.up_button_state,
+                'down_button': self.down_button_state,
+                'tip_distances': self.work_tip_distances.copy(),
+                'tip_states': dict(enumerate(self.tip_active[1:9], start=1))
+            }
+            self._queue_message("work_position_update", data=work_position_data)
             
         # Send tip data for home screen (live values)
-        tips_data = {}
-        for i in range(1, 9):
-            tips_data[i] = {
-                'active': getattr(self, f'tip{i}_active'),
-                'joules': getattr(self, f'tip{i}_joules'),
-                'distance': getattr(self, f'tip{i}_distance'),
-                'progress': getattr(self, f'tip{i}_progress')
-            }
+        # Compare a flat tuple snapshot; the payload dicts are only built on change
+        tips_snapshot = tuple(zip(
+            self.tip_active[1:], self.tip_joules[1:], self.tip_distance[1:], self.tip_progress[1:]
+        ))
         
-        modbus_data = {
-            'tips': tips_data
-        }
-        
-        if self._has_value_changed('tips_data', tips_data):
-            await self._send_message("modbus_update", payload=modbus_data)
+        if tips_snapshot != self._prev_tips_snapshot:
+            self._changed_this_tick = True
+            self._prev_tips_snapshot = tips_snapshot
+            tips_data = {
+                i: {'active': active, 'joules': joules, 'distance': distance, 'progress': progress}
+                for i, (active, joules, distance, progress) in enumerate(tips_snapshot, start=1)
+            }
             
-        # Send heating setpoint data for heating screen
-        heating_data = {}
-        for i in range(1, 9):
-            heating_data[i] = {
-                'energy': self.heating_energy_setpoints[i],
-                'distance': self.heating_distance_setpoints[i],
-                'heat_start_delay': self.heating_heat_start_delay_setpoints[i]
+            modbus_data = {
+                'tips': tips_data
             }
+            self._queue_message("modbus_update", payload=modbus_data)
+            
+        # Send heating setpoint data for heating screen
+        # Compare a flat tuple snapshot; the payload dicts are only built on change
+        heating_snapshot = tuple(zip(
+            self.heating_energy_setpoints.values(),
+            self.heating_distance_setpoints.values(),
+            self.heating_heat_start_delay_setpoints.values()
+        ))
         
-        heating_modbus_data = {
-            'heating_setpoints': heating_data
-        }
-        
-        if self._has_value_changed('heating_data', heating_data):
-            await self._send_message("heating_update", payload=heating_modbus_data)
-            print(f"Sent heating setpoints update: {heating_data}")
+        if heating_snapshot != self._prev_heating_snapshot:
+            self._changed_this_tick = True
+            self._prev_heating_snapshot = heating_snapshot
+            heating_data = {
+                i: {'energy': energy, 'distance': distance, 'heat_start_delay': delay}
+                for i, (energy, distance, delay) in enumerate(heating_snapshot, start=1)
+            }
+            
+            heating_modbus_data = {
+                'heating_setpoints': heating_data
+            }
+            self._queue_message("heating_update", payload=heating_modbus_data)
+            log.debug("Sent heating setpoints update: %s", heating_data)
 
         # Send monitor screen update
-        monitor_payload = {
-            'states': {
-                'left_start': self.monitor_left_start,
-                'right_start': self.monitor_right_start,
-                'estop_active': self.monitor_estop_active,
-                'home_switch': self.monitor_home_switch,
-                'pressure_ok': self.monitor_pressure_ok,
-            },
-            'pressure_psi': int(self.monitor_pressure_psi),
-        }
-        if self._has_value_changed('monitor_payload', monitor_payload):
-            await self._send_message("monitor_update", payload=monitor_payload)
-        
-        # Periodic heartbeat sync of tip active states for reliability
-        self.heartbeat_counter += 1
-        if self.heartbeat_counter >= self.heartbeat_interval:
-            self.heartbeat_counter = 0
-            await self._heartbeat_sync_tip_states()
+        # Compare a flat tuple snapshot; the payload dict is only built on change
+        monitor_snapshot = (
+            self.monitor_left_start, self.monitor_right_start, self.monitor_estop_active,
+            self.monitor_home_switch, self.monitor_pressure_ok, int(self.monitor_pressure_psi)
+        )
+        if monitor_snapshot != self._prev_monitor_snapshot:
+            self._changed_this_tick = True
+            self._prev_monitor_snapshot = monitor_snapshot
+            monitor_payload = {
+                'states': {
+                    'left_start': self.monitor_left_start,
+                    'right_start': self.monitor_right_start,
+                    'estop_active': self.monitor_estop_active,
+                    'home_switch': self.monitor_home_switch,
+                    'pressure_ok': self.monitor_pressure_ok,
+                },
+                'pressure_psi': monitor_snapshot[5],
+            }
+            self._queue_message("monitor_update", payload=monitor_payload)
 
-        # Always forward manual controls snapshot to UI to avoid missed states
-        # Throttle platen updates and avoid flicker by rounding to 0.1mm
-        # Also include up/down states for visual feedback
-        if not hasattr(self, '_manual_controls_tick'):
-            self._manual_controls_tick = 0
-        self._manual_controls_tick += 1
-        display_platen = round(float(self.current_position), 1)
-        manual_payload = {
-            'platen_mm': display_platen,
-            'up_pressed': bool(self.up_button_state),
-            'down_pressed': bool(self.down_button_state),
-        }
-        # Reduce send rate: only send when changed OR every 5 cycles (~10 Hz if base is 50 Hz)
-        should_send_manual = self._has_value_changed('manual_controls_payload', manual_payload) or (self._manual_controls_tick % 5 == 0)
-        if should_send_manual:
-            await self._send_message("manual_controls_update", payload=manual_payload)
-            
     async def handle_incoming_message(self, message_data):
         """Handle messages from the UI"""
         try:
-            msg_type = message_data.get('type')
-            
-            if msg_type == 'set_speed_mode':
-                # Update speed mode - queue for immediate write
-                mode = message_data.get('mode')
-                if mode == 'rapid':
-                    speed_value = 0
-                elif mode == 'fine':
-                    speed_value = 1
-                else:
-                    return
-                
-                # Queue immediate write
-                await self.button_write_queue.put({
-                    'type': 'speed_mode',
-                    'value': speed_value
-                })
-                    
-            elif msg_type == 'button_press':
-                # Momentary up/down button states (write-only)
-                button = message_data.get('button')
-                state = bool(message_data.get('state', False))
-                if button == 'up':
-                    self.up_button_state = state
-                elif button == 'down':
-                    self.down_button_state = state
-                if button in ['up', 'down']:
-                    await self.button_write_queue.put({'type': button, 'value': state})
-                    
-            elif msg_type == 'set_work_position':
-                # Set work position command
-                if self.modbus_client:
-                    addr = get_work_position_address('set_position_cmd')
-                    await self.modbus_client.write_register(addr, 1, slave=self.slave_id)
+            handler = self._message_handlers.get(message_data.get('type'))
+            if handler:
+                await handler(message_data)
+        except Exception as e:
+            log.error("Error handling message: %s", e)
+    
+    async def _handle_set_speed_mode(self, message_data):
+        """Queue a speed mode (rapid/fine) write"""
+        mode = message_data.get('mode')
+        if mode == 'rapid':
+            speed_value = 0
+        elif mode == 'fine':
+            speed_value = 1
+        else:
+            return
 
-            elif msg_type == 'manual_heat_button':
-                # Heating button toggle
-                tip = int(message_data.get('tip', 0))
-                state = bool(message_data.get('state', False))
-                if 1 <= tip <= 8:
-                    self.manual_heating_buttons[tip] = state
-                    if self.modbus_client:
-                        try:
-                            addr = get_manual_heating_button_address(tip)
-                            await self.modbus_client.write_register(addr, 1 if state else 0, slave=self.slave_id)
-                        except Exception as e:
-                            print(f"Error writing manual heat button {tip}: {e}")
+        # Queue immediate write
+        self._enqueue_button_write('speed_mode', speed_value)
 
-            elif msg_type == 'manual_cooling':
-                state = bool(message_data.get('state', False))
-                self.manual_cooling_on = state
-                if self.modbus_client:
-                    try:
-                        addr = get_manual_cooling_address()
-                        await self.modbus_client.write_register(addr, 1 if state else 0, slave=self.slave_id)
-                    except Exception as e:
-                        print(f"Error writing manual cooling: {e}")
-                    
-            elif msg_type == 'request_all_values':
-                # Send all current values when page loads/reconnects
-                # Don't read fresh data first - use cached values for speed
-                await self.send_all_current_values()
-                # Then read fresh data in background
-                asyncio.create_task(self.read_modbus_data())
-                
-            elif msg_type == 'request_work_position_state':
-                # Force read latest data from Modbus
-                await self.read_modbus_data()
-                
-                # Send current work position state
-                work_position_data = {
-                    'current_position': self.current_position,
-                    'setpoint': self.setpoint,
-                    'speed_mode': 'rapid' if self.speed_mode == 0 else 'fine',
-                    'up_button': self.up_button_state,
-                    'down_button': self.down_button_state,
-                    'tip_distances': self.work_tip_distances.copy(),
-                    'tip_states': {i: getattr(self, f'tip{i}_active') for i in range(1, 9)}
-                }
-                await self._send_message("work_position_update", data=work_position_data)
-                
-            elif msg_type == 'update_tip_active':
-                # Update tip active state from heating screen
-                tip_number = message_data.get('tipNumber')
-                active = message_data.get('active', False)
-                
-                if tip_number and 1 <= tip_number <= 8:
-                    # Update local state immediately
-                    setattr(self, f'tip{tip_number}_active', active)
-                    print(f"Updated tip {tip_number} active state to {active}")
-                    
-                    # Write to Modbus for the slave to know
-                    if self.modbus_client:
-                        addr = get_tip_address(tip_number, 'active')
-                        value = 1 if active else 0
-                        result = await self.modbus_client.write_register(addr, value, slave=self.slave_id)
-                        if result.isError():
-                            print(f"Error writing tip {tip_number} active state to Modbus: {result}")
-                        else:
-                            print(f"Successfully wrote tip {tip_number} active state {value} to Modbus address {addr}")
-                    
-                    # The JSON file is already updated by the main process
-                    
-            elif msg_type == 'update_heating_energy':
-                # Write heating energy setpoint to Modbus
-                tip_number = message_data.get('tipNumber')
-                value = message_data.get('value', 0.0)
-                
-                if tip_number and 1 <= tip_number <= 8 and self.modbus_client:
-                    addr = get_heating_energy_address(tip_number)
-                    high, low = float_to_registers(value, scale=10)
-                    result = await self.modbus_client.write_registers(addr, [high, low], slave=self.slave_id)
-                    if result.isError():
-                        print(f"❌ WRITE FAILED: Tip {tip_number} energy {value}J to addr {addr}: {result}")
-                    else:
-                        print(f"✅ WROTE: Tip {tip_number} energy {value}J to addr {addr} [regs: {high},{low}]")
-                else:
-                    print(f"❌ CANNOT WRITE: tip={tip_number}, client={self.modbus_client is not None}")
-                        
-            elif msg_type == 'update_heating_distance':
-                # Write heating distance setpoint to Modbus
-                tip_number = message_data.get('tipNumber')
-                value = message_data.get('value', 0.0)
-                
-                if tip_number and 1 <= tip_number <= 8 and self.modbus_client:
-                    addr = get_heating_distance_address(tip_number)
-                    high, low = float_to_registers(value, scale=1000)
-                    result = await self.modbus_client.write_registers(addr, [high, low], slave=self.slave_id)
-                    if result.isError():
-                        print(f"❌ WRITE FAILED: Tip {tip_number} distance {value}mm to addr {addr}: {result}")
-                    else:
-                        print(f"✅ WROTE: Tip {tip_number} distance {value}mm to addr {addr} [regs: {high},{low}]")
-                else:
-                    print(f"❌ CANNOT WRITE: tip={tip_number}, client={self.modbus_client is not None}")
-                        
-            elif msg_type == 'update_heating_heat_start_delay':
-                # Write heating heat start delay setpoint to Modbus
-                tip_number = message_data.get('tipNumber')
-                value = message_data.get('value', 0.0)
-                
-                if tip_number and 1 <= tip_number <= 8 and self.modbus_client:
-                    addr = get_heating_heat_start_delay_address(tip_number)
-                    high, low = float_to_registers(value, scale=1000)
-                    result = await self.modbus_client.write_registers(addr, [high, low], slave=self.slave_id)
-                    if result.isError():
-                        print(f"❌ WRITE FAILED: Tip {tip_number} heat start delay {value}sec to addr {addr}: {result}")
-                    else:
-                        print(f"✅ WROTE: Tip {tip_number} heat start delay {value}sec to addr {addr} [regs: {high},{low}]")
+    async def _handle_button_press(self, message_data):
+        """Track and queue a momentary up/down button state"""
+        # Momentary up/down button states (write-only)
+        button = message_data.get('button')
+        state = bool(message_data.get('state', False))
+        if button == 'up':
+            self.up_button_state = state
+        elif button == 'down':
+            self.down_button_state = state
+        if button in ['up', 'down']:
+            self._enqueue_button_write(button, state)
+
+    async def _handle_set_work_position(self, message_data):
+        """Send the set work position command"""
+        if self.modbus_client:
+            addr = WP_SET_POSITION_CMD
+            await self._write_register(addr, 1)
+
+    async def _handle_manual_heat_button(self, message_data):
+        """Write a manual heating button state"""
+        tip = int(message_data.get('tip', 0))
+        state = bool(message_data.get('state', False))
+        if 1 <= tip <= 8:
+            self.manual_heating_buttons[tip] = state
+            if self.modbus_client:
+                try:
+                    addr = MANUAL_HEATING_BUTTONS[tip - 1]
+                    await self._write_register(addr, 1 if state else 0)
+                except Exception as e:
+                    log.error("Error writing manual heat button %s: %s", tip, e)
+
+    async def _handle_manual_cooling(self, message_data):
+        """Write the manual cooling button state"""
+        state = bool(message_data.get('state', False))
+        self.manual_cooling_on = state
+        if self.modbus_client:
+            try:
+                addr = MANUAL_COOLING
+                await self._write_register(addr, 1 if state else 0)
+            except Exception as e:
+                log.error("Error writing manual cooling: %s", e)
+
+    async def _handle_request_all_values(self, message_data):
+        """Resend all cached values, then refresh from Modbus"""
+        # Send all current values when page loads/reconnects
+        # Don't read fresh data first - use cached values for speed
+        await self.send_all_current_values()
+        # Then read fresh data in background
+        asyncio.create_task(self.read_modbus_data(force_text=True))
+
+    async def _handle_request_work_position_state(self, message_data):
+        """Send a fresh work position snapshot"""
+        # Force read latest data from Modbus
+        await self.read_modbus_data()
+
+        # Send current work position state
+        work_position_data = {
+            'current_position': self.current_position,
+            'setpoint': self.setpoint,
+            'speed_mode': 'rapid' if self.speed_mode == 0 else 'fine',
+            'up_button': self.up_button_state,
+            'down_button': self.down_button_state,
+            'tip_distances': self.work_tip_distances.copy(),
+            'tip_states': dict(enumerate(self.tip_active[1:9], start=1))
+        }
+        await self._send_message("work_position_update", data=work_position_data)
+
+    async def _handle_update_tip_active(self, message_data):
+        """Apply a tip active state change from the heating screen"""
+        tip_number = message_data.get('tipNumber')
+        active = message_data.get('active', False)
+
+        if tip_number and 1 <= tip_number <= 8:
+            # Update local state immediately
+            self.tip_active[tip_number] = active
+            log.debug("Updated tip %s active state to %s", tip_number, active)
+
+            # Write to Modbus for the slave to know
+            if self.modbus_client:
+                addr = TIP_ADDRESSES[(tip_number, 'active')]
+                value = 1 if active else 0
+                result = await self._write_register(addr, value)
+                if result.isError():
+                    log.warning("Error writing tip %s active state to Modbus: %s", tip_number, result)
                 else:
-                    print(f"❌ CANNOT WRITE: tip={tip_number}, client={self.modbus_client is not None}")
+                    log.debug("Successfully wrote tip %s active state %d to Modbus address %d", tip_number, value, addr)
 
-            elif msg_type == 'update_configuration':
-                # Write a configuration counter to Modbus
-                key = message_data.get('key')
-                value = message_data.get('value', 0.0)
+            # The JSON file is already updated by the main process
 
-                if self.modbus_client and key:
-                    try:
-                        # Determine scale by key
-                        if key in ['weld_time', 'cool_time']:
-                            scale = 100
-                        elif key in ['pulse_energy']:
-                            scale = 10
-                        else:
-                            scale = 1000
-                        addr = get_configuration_address(key)
-                        high, low = float_to_registers(value, scale=scale)
-                        result = await self.modbus_client.write_registers(addr, [high, low], slave=self.slave_id)
-                        if result.isError():
-                            print(f"❌ WRITE FAILED: Config {key}={value} to addr {addr}: {result}")
-                        else:
-                            print(f"✅ WROTE: Config {key}={value} to addr {addr} [regs: {high},{low}] scale={scale}")
-                    except Exception as e:
-                        print(f"❌ Error writing configuration {key}: {e}")
-                    
-            elif msg_type == 'request_heating_values':
-                # Send current heating setpoint values
-                # Force read from Modbus first
-                await self.read_modbus_data()
-                
-                # Send heating setpoint data
-                heating_data = {}
-                for i in range(1, 9):
-                    heating_data[i] = {
-                        'energy': self.heating_energy_setpoints[i],
-                        'distance': self.heating_distance_setpoints[i]
-                    }
-                
-                await self._send_message("heating_update", payload={'heating_setpoints': heating_data})
-                print(f"Sent heating update: {heating_data}")
-                    
-        except Exception as e:
-            print(f"Error handling message: {e}")
+    async def _handle_update_heating_energy(self, message_data):
+        """Write a heating energy setpoint"""
+        tip_number = message_data.get('tipNumber')
+        value = message_data.get('value', 0.0)
+
+        if tip_number and 1 <= tip_number <= 8 and self.modbus_client:
+            addr = HEATING_ENERGY_ADDRESSES[tip_number]
+            high, low = float_to_registers(value, scale=10)
+            self._queue_register_write(addr, [high, low], f"Tip {tip_number} energy {value}J")
+        else:
+            log.warning("❌ CANNOT WRITE: tip=%s, client=%s", tip_number, self.modbus_client is not None)
+
+    async def _handle_update_heating_distance(self, message_data):
+        """Write a heating distance setpoint"""
+        tip_number = message_data.get('tipNumber')
+        value = message_data.get('value', 0.0)
+
+        if tip_number and 1 <= tip_number <= 8 and self.modbus_client:
+            addr = HEATING_DISTANCE_ADDRESSES[tip_number]
+            high, low = float_to_registers(value, scale=1000)
+            self._queue_register_write(addr, [high, low], f"Tip {tip_number} distance {value}mm")
+        else:
+            log.warning("❌ CANNOT WRITE: tip=%s, client=%s", tip_number, self.modbus_client is not None)
+
+    async def _handle_update_heating_heat_start_delay(self, message_data):
+        """Write a heating heat start delay setpoint"""
+        tip_number = message_data.get('tipNumber')
+        value = message_data.get('value', 0.0)
+
+        if tip_number and 1 <= tip_number <= 8 and self.modbus_client:
+            addr = HEATING_HEAT_START_DELAY_ADDRESSES[tip_number]
+            high, low = float_to_registers(value, scale=1000)
+            self._queue_register_write(addr, [high, low], f"Tip {tip_number} heat start delay {value}sec")
+        else:
+            log.warning("❌ CANNOT WRITE: tip=%s, client=%s", tip_number, self.modbus_client is not None)
+
+    async def _handle_update_configuration(self, message_data):
+        """Write a configuration counter"""
+        key = message_data.get('key')
+        value = message_data.get('value', 0.0)
+
+        if self.modbus_client and key:
+            try:
+                addr = get_configuration_address(key)
+                scale = CONFIGURATION_SCALES[key]
+                high, low = float_to_registers(value, scale=scale)
+                self._queue_register_write(addr, [high, low], f"Config {key}={value} (scale={scale})")
+            except Exception as e:
+                log.error("❌ Error writing configuration %s: %s", key, e)
+
+    async def _handle_request_heating_values(self, message_data):
+        """Send the current heating setpoints"""
+        # Force read from Modbus first, including the cached heating blocks
+        for region in self._dirty:
+            self._dirty[region] = True
+        await self.read_modbus_data()
+
+        # Send heating setpoint data
+        heating_data = {}
+        for i in range(1, 9):
+            heating_data[i] = {
+                'energy': self.heating_energy_setpoints[i],
+                'distance': self.heating_distance_setpoints[i]
+            }
+
+        await self._send_message("heating_update", payload={'heating_setpoints': heating_data})
+        log.debug("Sent heating update: %s", heating_data)
     
     async def listen_for_messages(self):
         """Listen for incoming WebSocket messages"""
         try:
             while self.connected:
                 message = await self.websocket.recv()
-                data = json.loads(message)
+                self._idle_ticks = 0  # UI activity: poll at full rate again
+                self._wake.set()
+                data = _loads(message)
                 await self.handle_incoming_message(data)
         except websockets.exceptions.ConnectionClosed:
-            print("WebSocket connection closed")
+            log.info("WebSocket connection closed")
             self.connected = False
         except Exception as e:
-            print(f"Error in message listener: {e}")
+            log.error("Error in message listener: %s", e)
     
+    def _queue_register_write(self, addr, values, label):
+        """Queue a setpoint/configuration write for process_register_writes"""
+        self.register_write_queue.put_nowait((addr, values, label))
+        
+    def _mark_dirty(self, addr, count):
+        """Flag cached setpoint blocks overlapping addr..addr+count for re-read"""
+        for region, start, end in self._dirty_ranges:
+            if addr < end and start < addr + count:
+                self._dirty[region] = True
+                
+    async def process_register_writes(self):
+        """Process queued setpoint writes, merging adjacent registers into one request"""
+        while True:
+            try:
+                addr, values, label = await self.register_write_queue.get()
+                
+                # Let a burst of edits gather, then keep the last write per address
+                await asyncio.sleep(self.write_coalesce_window)
+                pending = {addr: (values, label)}
+                while not self.register_write_queue.empty():
+                    addr, values, label = self.register_write_queue.get_nowait()
+                    pending[addr] = (values, label)
+                    
+                if not self.modbus_client:
+                    continue
+                    
+                writes = [(addr, values) for addr, (values, _) in pending.items()]
+                for start, values in coalesce_write_packets(writes):
+                    end = start + len(values)
+                    labels = ', '.join(label for addr, (_, label) in sorted(pending.items()) if start <= addr < end)
+                    try:
+                        result = await self._write_registers(start, values)
+                    except Exception as e:
+                        log.warning("❌ WRITE FAILED: %s to addr %d: %s", labels, start, e)
+                        continue
+                    finally:
+                        # Re-read the written block even if the write failed
+                        self._mark_dirty(start, len(values))
+                    if result.isError():
+                        log.warning("❌ WRITE FAILED: %s to addr %d: %s", labels, start, result)
+                    else:
+                        log.debug("✅ WROTE: %s to addr %d [regs: %s]", labels, start, values)
+                        
+            except Exception as e:
+                log.error("Error in register write processor: %s", e)
+                await asyncio.sleep(0.1)
+                
+    def _enqueue_button_write(self, button_type, value):
+        """Queue a button write; a full queue is collapsed to the latest value per button"""
+        queue = self.button_write_queue
+        if queue.full():
+            # Only the latest state of each button matters to the writer
+            latest = {}
+            while not queue.empty():
+                request = queue.get_nowait()
+                latest[request['type']] = request['value']
+            for queued_type, queued_value in latest.items():
+                queue.put_nowait({'type': queued_type, 'value': queued_value})
+        queue.put_nowait({'type': button_type, 'value': value})
+        
     async def process_button_writes(self):
         """Process immediate button writes from the queue"""
         while True:
@@ -930,78 +1181,120 @@ class ModbusSimpleUSHSController:
                 # Wait for button write request
                 write_request = await self.button_write_queue.get()
                 
+                # Drain any burst queued behind it; the last value per button wins
+                batch = {write_request['type']: write_request['value']}
+                while not self.button_write_queue.empty():
+                    queued = self.button_write_queue.get_nowait()
+                    batch[queued['type']] = queued['value']
+                
                 if not self.modbus_client:
                     continue
                 
-                write_type = write_request['type']
-                value = write_request['value']
+                self._inflight.update(batch)
+                
+                # speed_mode/up/down live at 1304-1306, so adjacent ones go out in one write
+                writes = {}
+                for write_type, value in batch.items():
+                    if write_type == 'speed_mode':
+                        writes[WP_SPEED_MODE] = value
+                    elif write_type == 'up':
+                        writes[WP_UP_BUTTON] = 1 if value else 0
+                    elif write_type == 'down':
+                        writes[WP_DOWN_BUTTON] = 1 if value else 0
+                
+                runs = []
+                for addr in sorted(writes):
+                    if runs and runs[-1][0] + len(runs[-1][1]) == addr:
+                        runs[-1][1].append(writes[addr])
+                    else:
+                        runs.append((addr, [writes[addr]]))
                 
                 # Perform immediate write with retry
                 max_retries = 3
                 for retry in range(max_retries):
                     try:
-                        if write_type == 'speed_mode':
-                            addr = get_work_position_address('speed_mode')
-                            await self.modbus_client.write_register(addr, value, slave=self.slave_id)
-                            self.speed_mode = value
-                            self.last_button_states['speed_mode'] = value
-                            print(f"Speed mode written: {value}")
-                            
-                        elif write_type == 'up':
-                            addr = get_work_position_address('up_button_state')
-                            await self.modbus_client.write_register(addr, 1 if value else 0, slave=self.slave_id)
-                            self.up_button_state = value
-                            self.last_button_states['up'] = value
-                            print(f"Up button state written: {value}")
-                            
-                        elif write_type == 'down':
-                            addr = get_work_position_address('down_button_state')
-                            await self.modbus_client.write_register(addr, 1 if value else 0, slave=self.slave_id)
-                            self.down_button_state = value
-                            self.last_button_states['down'] = value
-                            print(f"Down button state written: {value}")
+                        while runs:
+                            addr, values = runs[0]
+                            if len(values) == 1:
+                                await self._write_register(addr, values[0])
+                            else:
+                                await self._write_registers(addr, values)
+                            runs.pop(0)
                         
                         # Success - break retry loop
                         break
                         
                     except Exception as e:
-                        print(f"Button write error (retry {retry+1}/{max_retries}): {e}")
+                        log.warning("Button write error (retry %d/%d): %s", retry + 1, max_retries, e)
                         if retry < max_retries - 1:
                             await asyncio.sleep(0.01)  # Short delay before retry
+                
+                self._inflight.difference_update(batch)
+                
+                if runs:
+                    # Retries exhausted; keep the previous cached states
+                    continue
+                
+                # Read back right away instead of waiting out the poll interval
+                self._wake.set()
+                
+                if 'speed_mode' in batch:
+                    value = batch['speed_mode']
+                    self.speed_mode = value
+                    self.last_button_states['speed_mode'] = value
+                    log.debug("Speed mode written: %s", value)
+                if 'up' in batch:
+                    value = batch['up']
+                    self.up_button_state = value
+                    self.last_button_states['up'] = value
+                    log.debug("Up button state written: %s", value)
+                if 'down' in batch:
+                    value = batch['down']
+                    self.down_button_state = value
+                    self.last_button_states['down'] = value
+                    log.debug("Down button state written: %s", value)
                         
             except Exception as e:
-                print(f"Error in button write processor: {e}")
+                log.error("Error in button write processor: %s", e)
                 await asyncio.sleep(0.1)
-            
+    
     async def run_update_loop(self):
         """Main update loop - reads from Modbus and updates UI"""
-        print("Starting Modbus update loop...")
+        log.info("Starting Modbus update loop...")
         
         # Start concurrent tasks
         listener_task = asyncio.create_task(self.listen_for_messages())
         button_writer_task = asyncio.create_task(self.process_button_writes())
+        register_writer_task = asyncio.create_task(self.process_register_writes())
         
+        next_deadline = time.monotonic()
         try:
             while self.connected:
                 try:
-                    # Read data from Modbus
-                    success = await self.read_modbus_data()
-                    
-                    if success:
-                        # Update UI with changed values
-                        await self.update_changed_values()
+                    if not await self.tick():
+                        log.warning("Failed to read Modbus data")
                         
-                        # Verify button states and fix any discrepancies
-                        await self.verify_button_states()
+                    # Wait for next update cycle, doubling the interval every
+                    # 10 idle ticks up to max_idle_interval; a button write wakes us early.
+                    # Pacing is against a monotonic deadline so the work done this
+                    # tick doesn't stretch the period.
+                    delay = self._next_update_delay()
+                    now = time.monotonic()
+                    next_deadline += delay
+                    if now - next_deadline > delay:
+                        next_deadline = now + delay  # Too far behind: don't burst to catch up
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=max(0, next_deadline - now))
+                    except asyncio.TimeoutError:
+                        pass
                     else:
-                        print("Failed to read Modbus data")
-                        
-                    # Wait for next update cycle
-                    await asyncio.sleep(self.update_interval)
+                        next_deadline = time.monotonic()  # Woken early: restart the schedule
+                    self._wake.clear()
                     
                 except Exception as e:
-                    print(f"Error in update loop: {e}")
+                    log.error("Error in update loop: %s", e)
                     await asyncio.sleep(1)  # Wait a bit before retrying
+                    next_deadline = time.monotonic()
         finally:
             # Cancel tasks if they're still running
             listener_task.cancel()
@@ -1014,68 +1307,124 @@ class ModbusSimpleUSHSController:
                 await button_writer_task
             except asyncio.CancelledError:
                 pass
+            register_writer_task.cancel()
+            try:
+                await register_writer_task
+            except asyncio.CancelledError:
+                pass
     
-    async def verify_button_states(self):
-        """Verify button states match expected values and fix if needed"""
-        # Check if button states from Modbus match what we expect
-        if self.up_button_state != self.last_button_states.get('up', False):
-            # Mismatch - rewrite the correct state
-            await self.button_write_queue.put({
-                'type': 'up',
-                'value': self.last_button_states.get('up', False)
-            })
+    async def tick(self):
+        """Run one update cycle: read Modbus, send changed values, reconcile buttons
+
+        Returns False if nothing could be read from the slave. The only awaits
+        are the Modbus reads and the single batched WebSocket send.
+        """
+        # Read data from Modbus
+        if not await self.read_modbus_data():
+            return False
             
-        if self.down_button_state != self.last_button_states.get('down', False):
-            # Mismatch - rewrite the correct state
-            await self.button_write_queue.put({
-                'type': 'down',
-                'value': self.last_button_states.get('down', False)
-            })
+        # Update UI with changed values
+        self._changed_this_tick = False
+        await self.update_changed_values()
+        if self._changed_this_tick:
+            self._idle_ticks = 0
+        else:
+            self._idle_ticks += 1
             
-        if self.speed_mode != self.last_button_states.get('speed_mode', 0):
-            # Mismatch - rewrite the correct state
-            await self.button_write_queue.put({
-                'type': 'speed_mode',
-                'value': self.last_button_states.get('speed_mode', 0)
-            })
+        # Verify button states and fix any discrepancies
+        self.verify_button_states()
+        return True
+        
+    def _next_update_delay(self):
+        """Delay before the next poll; backs off while nothing is changing"""
+        backoff = 1 << min(self._idle_ticks // 10, 4)
+        # Never poll faster than the configured rate, even if it is below max_idle_interval
+        return max(self.update_interval, min(self.max_idle_interval, self.update_interval * backoff))
+    
+    def verify_button_states(self):
+        """Verify button states match expected values and fix if needed"""
+        # Writes still queued or in flight will settle the state themselves;
+        # re-queuing now would only duplicate them
+        if not self.button_write_queue.empty():
+            return
+        
+        # Check if button states from Modbus match what we expect. A mismatch is
+        # only rewritten once it has persisted for mismatch_rewrite_streak polls,
+        # so a state the slave is still settling isn't rewritten
+        polled = (
+            ('up', self.up_button_state),
+            ('down', self.down_button_state),
+            ('speed_mode', self.speed_mode)
+        )
+        for key, value in polled:
+            expected = self.last_button_states[key]
+            if key in self._inflight or value == expected:
+                self._mismatch_streak[key] = 0
+                continue
                 
+            self._mismatch_streak[key] += 1
+            if self._mismatch_streak[key] >= self.mismatch_rewrite_streak:
+                # Persistent mismatch - rewrite the correct state
+                self._mismatch_streak[key] = 0
+                self._enqueue_button_write(key, expected)
+                
+
 
 
+def _positive_float(text):
+    """argparse type for rates that must be greater than zero"""
+    value = float(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {text}")
+    return value
+
 
 async def main():
     """Main entry point"""
-    import argparse
-    
     parser = argparse.ArgumentParser(description='Modbus Simple UI Controller')
     parser.add_argument('--port', default='/tmp/vserial1', help='Serial port for Modbus')
     parser.add_argument('--baudrate', type=int, default=1000000, help='Baudrate for Modbus')
     parser.add_argument('--slave-id', type=int, default=1, help='Modbus slave ID')
     parser.add_argument('--websocket', default='ws://localhost:8080', help='WebSocket URI')
+    parser.add_argument('--update-hz', type=_positive_float, default=50, help='Modbus poll rate while values are changing')
+    parser.add_argument('--heartbeat-hz', type=_positive_float, default=0.5, help='Rate of the periodic tip active state sync')
+    parser.add_argument('--log-level', default='INFO',
+                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                        help='Logging level (DEBUG adds per-write and per-update messages)')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=args.log_level, format='%(asctime)s %(levelname)s %(message)s')
+    
     # Create and run controller
     controller = ModbusSimpleUSHSController(
         serial_port=args.port,
         baudrate=args.baudrate,
-        slave_id=args.slave_id
+        slave_id=args.slave_id,
+        update_hz=args.update_hz,
+        heartbeat_hz=args.heartbeat_hz
     )
     
     try:
         # Connect with specified websocket URI
         connected = await controller.connect(args.websocket)
         if not connected:
-            print("Failed to connect to WebSocket")
+            log.error("Failed to connect to WebSocket")
             return
             
         # Run the update loop
         await controller.run_update_loop()
         
     except KeyboardInterrupt:
-        print("\nShutting down...")
+        log.info("Shutting down...")
     finally:
         await controller.disconnect()
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop  # Optional libuv-based event loop, lower per-await overhead
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
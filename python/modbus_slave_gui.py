@@ -16,6 +16,7 @@ import random
 import os
 import sys
 import json
+from collections import deque
 from datetime import datetime
 
 from pymodbus.server import StartAsyncSerialServer
@@ -56,6 +57,23 @@ class ModbusSlaveGUI:
         self.data_store = None
         self.context = None
         
+        # Register updates waiting on a coalescing timer (see schedule_update)
+        self._pending_updates = set()
+        
+        # Log lines waiting to be flushed into the log widget (see _drain_log)
+        self._log_buffer = deque(maxlen=500)
+        self.log_max_lines = 2000  # Older lines are trimmed from the log widget
+        
+        # Last text shown on value labels, to skip no-op reconfigures
+        self._label_text = {}
+        
+        # Per-cycle "Updated ..." messages are only logged in verbose mode;
+        # edits and button actions from the user are always logged
+        self.verbose_log = False
+        
+        # Last tip distance written per tip, to skip unchanged tips each cycle
+        self._tip_distance_written = {}
+        
         # Create GUI
         self.create_widgets()
         
@@ -289,8 +307,8 @@ class ModbusSlaveGUI:
         self.platen_spin = ttk.Spinbox(platen_box, from_=0, to=999.9, increment=0.1,
                                        textvariable=self.manual_platen_mm, width=10)
         self.platen_spin.grid(row=0, column=0, padx=5)
-        self.platen_spin.bind('<KeyRelease>', lambda e: self.update_manual_controls_data())
-        self.platen_spin.bind('<ButtonRelease-1>', lambda e: self.update_manual_controls_data())
+        self.platen_spin.bind('<KeyRelease>', lambda e: self.schedule_update(self.update_manual_controls_data))
+        self.platen_spin.bind('<ButtonRelease-1>', lambda e: self.schedule_update(self.update_manual_controls_data))
 
         # Heating buttons 1..8
         heat_box = ttk.LabelFrame(frame, text="Heating Buttons", padding="10")
@@ -398,13 +416,13 @@ class ModbusSlaveGUI:
         self.banner_text = tk.StringVar(value="USHS System Active")
         banner_entry = ttk.Entry(text_frame, textvariable=self.banner_text, width=40)
         banner_entry.grid(row=0, column=1, padx=5)
-        banner_entry.bind('<KeyRelease>', lambda e: self.update_text_data())
+        banner_entry.bind('<KeyRelease>', lambda e: self.schedule_update(self.update_text_data))
         
         ttk.Label(text_frame, text="Processing Text:").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
         self.processing_text = tk.StringVar(value="Processing...")
         processing_entry = ttk.Entry(text_frame, textvariable=self.processing_text, width=40)
         processing_entry.grid(row=1, column=1, padx=5, pady=(5, 0))
-        processing_entry.bind('<KeyRelease>', lambda e: self.update_text_data())
+        processing_entry.bind('<KeyRelease>', lambda e: self.schedule_update(self.update_text_data))
         
         general_frame.columnconfigure(0, weight=1)
         
@@ -424,8 +442,8 @@ class ModbusSlaveGUI:
         current_spin = ttk.Spinbox(pos_frame, from_=0, to=100, increment=0.1, 
                                   textvariable=self.current_position, width=10)
         current_spin.grid(row=0, column=1, padx=5)
-        current_spin.bind('<KeyRelease>', lambda e: self.update_work_position_data())
-        current_spin.bind('<ButtonRelease-1>', lambda e: self.update_work_position_data())
+        current_spin.bind('<KeyRelease>', lambda e: self.schedule_update(self.update_work_position_data))
+        current_spin.bind('<ButtonRelease-1>', lambda e: self.schedule_update(self.update_work_position_data))
         
         # Setpoint
         ttk.Label(pos_frame, text="Setpoint (mm):").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
@@ -433,8 +451,8 @@ class ModbusSlaveGUI:
         setpoint_spin = ttk.Spinbox(pos_frame, from_=0, to=100, increment=0.1, 
                                    textvariable=self.setpoint, width=10)
         setpoint_spin.grid(row=1, column=1, padx=5, pady=(5, 0))
-        setpoint_spin.bind('<KeyRelease>', lambda e: self.update_work_position_data())
-        setpoint_spin.bind('<ButtonRelease-1>', lambda e: self.update_work_position_data())
+        setpoint_spin.bind('<KeyRelease>', lambda e: self.schedule_update(self.update_work_position_data))
+        setpoint_spin.bind('<ButtonRelease-1>', lambda e: self.schedule_update(self.update_work_position_data))
         
         # Speed mode
         speed_frame = ttk.LabelFrame(work_frame, text="Speed Mode", padding="10")
@@ -599,11 +617,17 @@ class ModbusSlaveGUI:
         ttk.Button(button_frame, text="Clear Log", command=self.clear_log).pack(side=tk.LEFT, padx=5)
         self.autoscroll_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(button_frame, text="Auto-scroll", variable=self.autoscroll_var).pack(side=tk.LEFT, padx=5)
+        self.verbose_log_var = tk.BooleanVar(value=self.verbose_log)
+        ttk.Checkbutton(button_frame, text="Verbose", variable=self.verbose_log_var,
+                        command=self.toggle_verbose_log).pack(side=tk.LEFT, padx=5)
         
         # Debug buttons
         ttk.Button(button_frame, text="Debug Data Store", command=self.debug_data_store).pack(side=tk.LEFT, padx=5)
         ttk.Button(button_frame, text="Manual Test Write", command=self.manual_write_test).pack(side=tk.LEFT, padx=5)
         
+        # Flush buffered log lines periodically instead of on every log() call
+        self.root.after(100, self._drain_log)
+        
         return log_frame
         
     def initialize_data(self):
@@ -613,6 +637,9 @@ class ModbusSlaveGUI:
         # Manual controls extend up to 1915+, so allocate >= 2000 registers
         block = ModbusSequentialDataBlock(0, [0] * 2000)
         
+        # The new block starts zeroed, so nothing cached as written is in it
+        self._tip_distance_written = {}
+        
         self.data_store = ModbusSlaveContext(
             di=block,
             co=block,
@@ -648,35 +675,45 @@ class ModbusSlaveGUI:
         self.data_store.setValues(3, SYSTEM_CONFIG['slave_id'], [self.slave_id_var.get()])
         self.data_store.setValues(3, SYSTEM_CONFIG['update_rate'], [self.update_rate_var.get()])
         
-        # Update all tips
+        # Update all tips (logged below as one block)
         for i in range(1, 9):
-            self.update_tip_data(i)
+            self.update_tip_data(i, log=False)
             
         # Update progress states
         for state in self.progress_widgets:
-            self.update_progress_data(state)
+            self.update_progress_data(state, log=False)
             
         # Update general UI
-        self.update_general_data()
+        self.update_general_data(log=False)
         
         # Update text data
-        self.update_text_data()
+        self.update_text_data(log=False)
         
         # Update configuration counters
         self.update_configuration_data()
 
         # Update work position data
-        self.update_work_position_data()
+        self.update_work_position_data(log=False)
         
         # Update all tip distances
         for i in range(1, 9):
-            self.update_tip_distance(i)
+            self.update_tip_distance(i, log=False)
 
         # Update monitor screen registers
-        self.update_monitor_data()
+        self.update_monitor_data(log=False)
 
         # Update manual controls registers
-        self.update_manual_controls_data()
+        self.update_manual_controls_data(log=False)
+        
+        if self.verbose_log:
+            lines = ["Updated tip data:"]
+            for i, widgets in self.tip_widgets.items():
+                lines.append(
+                    f"  Tip {i}: active={widgets['active'].get()}, {widgets['progress'].get()}%, "
+                    f"{widgets['joules'].get():.1f}J, {widgets['distance'].get():.3f}mm, "
+                    f"work distance {self.tip_distances[i].get():.1f}mm"
+                )
+            self.log("\n".join(lines))
             
         # Initialize heating setpoints to zero
         # Actual values come from the heating screen via Modbus writes
@@ -697,7 +734,25 @@ class ModbusSlaveGUI:
             high, low = float_to_registers(0.0, scale=1000)
             self.data_store.setValues(3, heat_start_delay_addr, [high, low])
         
-    def update_tip_data(self, tip_num):
+    def schedule_update(self, callback):
+        """Coalesce a burst of edit events into a single register update"""
+        if callback in self._pending_updates:
+            return
+        self._pending_updates.add(callback)
+        self.root.after(20, self._run_pending_update, callback)
+        
+    def _run_pending_update(self, callback):
+        """Run a coalesced register update once its timer fires"""
+        self._pending_updates.discard(callback)
+        callback()
+        
+    def _set_label_text(self, label, text):
+        """Reconfigure a value label only when its text actually changes"""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.config(text=text)
+        
+    def update_tip_data(self, tip_num, log=True):
         """Update Modbus registers for a specific tip"""
         if not self.data_store or tip_num not in self.tip_widgets:
             return
@@ -712,7 +767,7 @@ class ModbusSlaveGUI:
         addr = get_tip_address(tip_num, 'progress')
         progress = widgets['progress'].get()
         self.data_store.setValues(3, addr, [progress])
-        widgets['progress_label'].config(text=f"{progress}%")
+        self._set_label_text(widgets['progress_label'], f"{progress}%")
         
         # Update joules (scaled by 10)
         addr = get_tip_address(tip_num, 'joules')
@@ -724,9 +779,10 @@ class ModbusSlaveGUI:
         distance_regs = float_to_registers(widgets['distance'].get(), 1000)
         self.data_store.setValues(3, addr, distance_regs)
         
-        self.log(f"Updated Tip {tip_num} data")
+        if log:
+            self.log(f"Updated Tip {tip_num} data")
 
-    def update_manual_controls_data(self):
+    def update_manual_controls_data(self, log=True):
         """Update Manual Controls Modbus registers"""
         if not self.data_store:
             return
@@ -747,11 +803,12 @@ class ModbusSlaveGUI:
             down_addr = get_work_position_address('down_button_state')
             self.data_store.setValues(3, down_addr, [1 if self.down_button.get() else 0])
 
-            self.log("Updated manual controls data")
+            if log or self.verbose_log:
+                self.log("Updated manual controls data")
         except Exception as e:
             self.log(f"Error updating manual controls: {e}")
         
-    def update_progress_data(self, state_name):
+    def update_progress_data(self, state_name, log=True):
         """Update Modbus register for a progress state"""
         if not self.data_store or state_name not in self.progress_widgets:
             return
@@ -760,9 +817,10 @@ class ModbusSlaveGUI:
         value = self.progress_widgets[state_name].get()
         self.data_store.setValues(3, addr, [value])
         
-        self.log(f"Updated progress state '{state_name}' to {value}")
+        if log or self.verbose_log:
+            self.log(f"Updated progress state '{state_name}' to {value}")
         
-    def update_general_data(self):
+    def update_general_data(self, log=True):
         """Update general UI Modbus registers"""
         if not self.data_store:
             return
@@ -778,11 +836,12 @@ class ModbusSlaveGUI:
         addr = get_general_ui_address('slider_percentage')
         percentage = int(self.slider_percentage.get())
         self.data_store.setValues(3, addr, [percentage])
-        self.slider_label.config(text=f"{percentage}%")
+        self._set_label_text(self.slider_label, f"{percentage}%")
         
-        self.log("Updated general UI data")
+        if log or self.verbose_log:
+            self.log("Updated general UI data")
         
-    def update_text_data(self):
+    def update_text_data(self, log=True):
         """Update text string Modbus registers"""
         if not self.data_store:
             return
@@ -797,9 +856,10 @@ class ModbusSlaveGUI:
         registers = string_to_registers(self.processing_text.get())
         self.data_store.setValues(3, addr, registers)
         
-        self.log("Updated text data")
+        if log or self.verbose_log:
+            self.log("Updated text data")
     
-    def update_work_position_data(self):
+    def update_work_position_data(self, log=True):
         """Update work position Modbus registers"""
         if not self.data_store:
             return
@@ -825,27 +885,32 @@ class ModbusSlaveGUI:
         addr = get_work_position_address('down_button_state')
         self.data_store.setValues(3, addr, [1 if self.down_button.get() else 0])
         
-        self.log("Updated work position data")
+        if log or self.verbose_log:
+            self.log("Updated work position data")
     
-    def update_tip_distance(self, tip_number):
+    def update_tip_distance(self, tip_number, log=True):
         """Update individual tip distance"""
         if not self.data_store:
             return
         
         distance = self.tip_distances[tip_number].get()
+        if self._tip_distance_written.get(tip_number) == distance:
+            return
+        self._tip_distance_written[tip_number] = distance
         
         # Update the label
         label = getattr(self, f'tip_{tip_number}_distance_label')
-        label.config(text=f"{distance:.1f}")
+        self._set_label_text(label, f"{distance:.1f}")
         
         # Update Modbus registers
         addr = get_work_position_tip_distance_address(tip_number)
         registers = float_to_registers(distance, 100)  # Scale by 100
         self.data_store.setValues(3, addr, registers)
         
-        self.log(f"Updated tip {tip_number} distance: {distance:.1f} mm")
+        if log:
+            self.log(f"Updated tip {tip_number} distance: {distance:.1f} mm")
 
-    def update_monitor_data(self):
+    def update_monitor_data(self, log=True):
         """Write monitor values to Modbus registers"""
         if not self.data_store or not hasattr(self, 'monitor_vars'):
             return
@@ -856,7 +921,8 @@ class ModbusSlaveGUI:
             self.data_store.setValues(3, get_monitor_address('estop_active'), [1 if self.monitor_vars['estop_active'].get() else 0])
             self.data_store.setValues(3, get_monitor_address('home_switch'), [1 if self.monitor_vars['home_switch'].get() else 0])
             self.data_store.setValues(3, get_monitor_address('pressure_ok'), [1 if self.monitor_vars['pressure_ok'].get() else 0])
-            self.log("Updated monitor data")
+            if log or self.verbose_log:
+                self.log("Updated monitor data")
         except Exception as e:
             self.log(f"Error updating monitor data: {e}")
 
@@ -977,36 +1043,34 @@ class ModbusSlaveGUI:
         
     def update_loop(self):
         """Update loop for refreshing data at specified rate"""
-        last_update = time.time()
         update_interval = 1.0 / self.update_rate
+        next_update = time.monotonic()
         
         while not self.stop_event.is_set():
-            current_time = time.time()
+            # Read work position data from Modbus and update GUI
+            self.read_work_position_from_modbus()
             
-            if current_time - last_update >= update_interval:
-                # Read work position data from Modbus and update GUI
-                self.read_work_position_from_modbus()
-                
-                # Read heating setpoints from Modbus and update GUI display
-                self.read_heating_setpoints_from_modbus()
+            # Read heating setpoints from Modbus and update GUI display
+            self.read_heating_setpoints_from_modbus()
 
-                # Read configuration counters from Modbus and update GUI display
-                self.read_configuration_from_modbus()
-                
-                # Read tip active states from Modbus and update GUI
-                self.read_tip_states_from_modbus()
+            # Read configuration counters from Modbus and update GUI display
+            self.read_configuration_from_modbus()
+            
+            # Read tip active states from Modbus and update GUI
+            self.read_tip_states_from_modbus()
 
-                # Read monitor data
-                self.read_monitor_from_modbus()
+            # Read monitor data
+            self.read_monitor_from_modbus()
 
-                # Read manual controls (heating buttons, cooling, platen position)
-                self.read_manual_controls_from_modbus()
-                
-                # Update all Modbus data
-                self.update_all_modbus_data()
-                last_update = current_time
-                
-            time.sleep(0.001)  # Small sleep to prevent CPU hogging
+            # Read manual controls (heating buttons, cooling, platen position)
+            self.read_manual_controls_from_modbus()
+            
+            # Update all Modbus data
+            self.update_all_modbus_data()
+            
+            # Block until the next cycle is due; stop_server() wakes us immediately
+            next_update = max(next_update + update_interval, time.monotonic())
+            self.stop_event.wait(next_update - time.monotonic())
 
     def read_manual_controls_from_modbus(self):
         """Read manual controls registers and update GUI controls"""
@@ -1128,18 +1192,9 @@ class ModbusSlaveGUI:
         if not self.data_store or not hasattr(self, 'configuration_vars'):
             return
         try:
-            # Scales: weld_time, cool_time (scale 100); pulse_energy (scale 10); others (scale 1000)
-            def write_scaled(name, scale):
-                addr = get_configuration_address(name)
+            for name, scale in CONFIGURATION_SCALES.items():
                 high, low = float_to_registers(self.configuration_vars[name].get(), scale=scale)
-                self.data_store.setValues(3, addr, [high, low])
-
-            write_scaled('weld_time', 100)
-            write_scaled('pulse_energy', 10)
-            write_scaled('cool_time', 100)
-            write_scaled('presence_height', 1000)
-            write_scaled('boss_tolerance_minus', 1000)
-            write_scaled('boss_tolerance_plus', 1000)
+                self.data_store.setValues(3, CONFIGURATION_ADDRESSES[name], [high, low])
         except Exception as e:
             self.log(f"Error updating configuration data: {e}")
 
@@ -1148,17 +1203,10 @@ class ModbusSlaveGUI:
         if not self.data_store or not hasattr(self, 'configuration_vars'):
             return
         try:
-            def read_scaled(name, scale):
-                addr = get_configuration_address(name)
-                regs = self.data_store.getValues(3, addr, 2)
-                return registers_to_float(regs, scale=scale)
-
-            self.configuration_vars['weld_time'].set(round(read_scaled('weld_time', 100), 2))
-            self.configuration_vars['pulse_energy'].set(round(read_scaled('pulse_energy', 10), 1))
-            self.configuration_vars['cool_time'].set(round(read_scaled('cool_time', 100), 2))
-            self.configuration_vars['presence_height'].set(round(read_scaled('presence_height', 1000), 3))
-            self.configuration_vars['boss_tolerance_minus'].set(round(read_scaled('boss_tolerance_minus', 1000), 3))
-            self.configuration_vars['boss_tolerance_plus'].set(round(read_scaled('boss_tolerance_plus', 1000), 3))
+            for name, scale in CONFIGURATION_SCALES.items():
+                regs = self.data_store.getValues(3, CONFIGURATION_ADDRESSES[name], 2)
+                value = registers_to_float(regs, scale=scale)
+                self.configuration_vars[name].set(round(value, CONFIGURATION_DECIMALS[name]))
         except Exception as e:
             self.log(f"Error reading configuration data: {e}")
     
@@ -1298,6 +1346,7 @@ class ModbusSlaveGUI:
         
         # Update all data
         self.update_all_modbus_data()
+        self.log("Randomized all values")
         
     def reset_all(self):
         """Reset all values to defaults"""
@@ -1336,6 +1385,7 @@ class ModbusSlaveGUI:
         
         # Update all data
         self.update_all_modbus_data()
+        self.log("Reset all values to defaults")
         
     def save_config(self):
         """Save current configuration to file"""
@@ -1436,15 +1486,32 @@ class ModbusSlaveGUI:
             messagebox.showerror("Error", f"Failed to load configuration: {str(e)}")
             
     def log(self, message):
-        """Add message to log"""
+        """Add message to log (buffered; safe to call from worker threads)"""
         timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_entry = f"[{timestamp}] {message}\n"
-        
-        self.log_text.insert(tk.END, log_entry)
-        
-        if self.autoscroll_var.get():
-            self.log_text.see(tk.END)
+        self._log_buffer.append(f"[{timestamp}] {message}")
+        
+    def _drain_log(self):
+        """Flush buffered log lines into the log widget with a single insert"""
+        if self._log_buffer:
+            lines = []
+            while self._log_buffer:
+                lines.append(self._log_buffer.popleft())
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            
+            # Keep the widget bounded to the most recent lines
+            line_count = int(self.log_text.index('end-1c').split('.')[0])
+            if line_count > self.log_max_lines:
+                self.log_text.delete('1.0', f"{line_count - self.log_max_lines}.0")
             
+            if self.autoscroll_var.get():
+                self.log_text.see(tk.END)
+                
+        self.root.after(100, self._drain_log)
+            
+    def toggle_verbose_log(self):
+        """Mirror the Verbose checkbox into a plain bool readable from worker threads"""
+        self.verbose_log = self.verbose_log_var.get()
+        
     def clear_log(self):
         """Clear the log text"""
         self.log_text.delete(1.0, tk.END)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for the register map and its conversion helpers (run from python/: python -m unittest)
+"""
+import os
+import sys
+import unittest
+
+import modbus_map
+from modbus_map import (
+    MAX_WRITE_COUNT, TIP_OFFSET, coalesce_write_packets, float_to_registers,
+    registers_to_floats, registers_to_string, string_to_registers
+)
+
+
+class ModuleTest(unittest.TestCase):
+    def test_single_modbus_map_on_path(self):
+        found = set()
+        for entry in sys.path:
+            entry = os.path.abspath(entry or os.getcwd())
+            for candidate in (os.path.join(entry, 'modbus_map.py'),
+                              os.path.join(entry, 'modbus_map', '__init__.py')):
+                if os.path.isfile(candidate):
+                    found.add(os.path.realpath(candidate))
+        self.assertEqual(found, {os.path.realpath(modbus_map.__file__)})
+
+    def test_public_names_resolve(self):
+        for name in modbus_map.__all__:
+            self.assertTrue(hasattr(modbus_map, name), name)
+
+    def test_tables_are_read_only(self):
+        with self.assertRaises(TypeError):
+            TIP_OFFSET['active'] = 1
+
+
+class CoalesceWritePacketsTest(unittest.TestCase):
+    def test_adjacent_writes_merge_in_address_order(self):
+        writes = [(1502, [3, 4]), (1500, [1, 2])]
+        self.assertEqual(coalesce_write_packets(writes), [(1500, [1, 2, 3, 4])])
+
+    def test_gap_is_never_written(self):
+        writes = [(1500, [1, 2]), (1503, [3, 4])]
+        self.assertEqual(coalesce_write_packets(writes), [(1500, [1, 2]), (1503, [3, 4])])
+
+    def test_merge_respects_max_count(self):
+        writes = [(0, [0] * (MAX_WRITE_COUNT - 1)), (MAX_WRITE_COUNT - 1, [1, 1])]
+        self.assertEqual([len(v) for _, v in coalesce_write_packets(writes)],
+                         [MAX_WRITE_COUNT - 1, 2])
+
+    def test_inputs_are_not_mutated(self):
+        first = [1, 2]
+        coalesce_write_packets([(10, first), (12, [3])])
+        self.assertEqual(first, [1, 2])
+
+    def test_empty(self):
+        self.assertEqual(coalesce_write_packets([]), [])
+
+
+class RegistersToFloatsTest(unittest.TestCase):
+    def test_round_trips_float_to_registers(self):
+        values = [0.0, 1.5, 123.456, 65.536]
+        regs = [r for v in values for r in float_to_registers(v)]
+        self.assertEqual(registers_to_floats(regs), values)
+
+    def test_scale(self):
+        self.assertEqual(registers_to_floats([0, 55, 1, 0], scale=10), [5.5, 6553.6])
+
+    def test_trailing_odd_register_is_ignored(self):
+        self.assertEqual(registers_to_floats([0, 1000, 7]), [1.0])
+
+
+class StringRegistersTest(unittest.TestCase):
+    def test_round_trip(self):
+        self.assertEqual(registers_to_string(string_to_registers('Heating tip 3')), 'Heating tip 3')
+
+    def test_out_of_range_registers_are_masked(self):
+        self.assertEqual(registers_to_string([0x14142, 0x10043]), 'ABC')
+
+
+if __name__ == '__main__':
+    unittest.main()
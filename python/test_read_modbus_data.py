@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for the controller's read sweep (run from python/: python -m unittest)
+"""
+import unittest
+
+from pymodbus.exceptions import ModbusIOException
+
+from modbus_map import HEATING_ENERGY_BASE, TIP_BASE_ADDRESSES
+from modbus_simple_ui_controller import READ_PLAN, ModbusSimpleUSHSController
+
+
+class _Response:
+    def __init__(self, registers=None, error=False):
+        self.registers = registers or []
+        self._error = error
+
+    def isError(self):
+        return self._error
+
+
+class _FakeClient:
+    """Holding-register reads against a flat memory; error_at/raise_all simulate faults"""
+
+    def __init__(self, error_at=(), raise_all=False):
+        self.mem = [0] * 2000
+        self.error_at = set(error_at)
+        self.raise_all = raise_all
+        self.reads = []
+
+    async def read_holding_registers(self, address, count, slave=1):
+        self.reads.append(address)
+        if self.raise_all:
+            raise ModbusIOException("no response")
+        if address in self.error_at:
+            return _Response(error=True)
+        return _Response(self.mem[address:address + count])
+
+    async def write_register(self, address, value, slave=1):
+        return _Response()
+
+    async def write_registers(self, address, values, slave=1):
+        return _Response()
+
+
+class ReadModbusDataTest(unittest.IsolatedAsyncioTestCase):
+    def _controller(self, client):
+        controller = ModbusSimpleUSHSController()
+        controller.modbus_client = client
+        controller._bind_modbus()
+        return controller
+
+    async def test_transport_failure_stops_the_sweep(self):
+        client = _FakeClient(raise_all=True)
+        controller = self._controller(client)
+        with self.assertLogs('modbus_simple_ui_controller', 'WARNING'):
+            self.assertFalse(await controller.read_modbus_data(force_text=True))
+        self.assertEqual(len(client.reads), 1)
+
+    async def test_error_response_skips_only_that_region(self):
+        client = _FakeClient(error_at={TIP_BASE_ADDRESSES[1] + 1})
+        client.mem[TIP_BASE_ADDRESSES[2] + 2] = 55  # tip 2 joules * 10
+        controller = self._controller(client)
+        with self.assertLogs('modbus_simple_ui_controller', 'WARNING'):
+            self.assertTrue(await controller.read_modbus_data(force_text=True))
+        self.assertEqual(len(client.reads), len(READ_PLAN))
+        self.assertEqual(controller.tip_joules[2], 5.5)
+
+    async def test_all_error_responses_is_not_a_read(self):
+        client = _FakeClient(error_at={start for _, start, *_ in READ_PLAN})
+        controller = self._controller(client)
+        with self.assertLogs('modbus_simple_ui_controller', 'WARNING'):
+            self.assertFalse(await controller.read_modbus_data(force_text=True))
+        self.assertEqual(len(client.reads), len(READ_PLAN))
+
+    async def test_error_response_leaves_setpoint_block_dirty(self):
+        client = _FakeClient(error_at={HEATING_ENERGY_BASE})
+        controller = self._controller(client)
+        with self.assertLogs('modbus_simple_ui_controller', 'WARNING'):
+            await controller.read_modbus_data()
+        self.assertTrue(controller._dirty['heating_energy'])
+        self.assertFalse(controller._dirty['heating_distance'])
+
+
+if __name__ == '__main__':
+    unittest.main()